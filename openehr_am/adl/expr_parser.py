@@ -18,6 +18,7 @@ No evaluation or semantic validation is performed.
 # Spec: https://specifications.openehr.org/releases/AM/latest/ADL2.html
 """
 
+import sys
 from dataclasses import dataclass
 
 from openehr_am.adl.expr_ast import (
@@ -114,6 +115,21 @@ _SIMPLE_TOKENS: dict[str, str] = {
     ">": "GT",
 }
 
+_TWO_CHAR_TOKENS: dict[str, str] = {
+    "!=": "NE",
+    "<=": "LE",
+    ">=": "GE",
+}
+
+_KEYWORDS: dict[str, str] = {
+    "and": "AND",
+    "or": "OR",
+    "not": "NOT",
+    "true": "TRUE",
+    "false": "FALSE",
+    "null": "NULL",
+}
+
 
 def _tokenize(
     text: str,
@@ -122,25 +138,17 @@ def _tokenize(
     start_line: int,
     start_col: int,
 ) -> list[_Token]:
+    # Hot loop: scan runs with local indices and update line/col once per
+    # token rather than calling a per-character `advance()` helper. Only
+    # whitespace and string literals can span newlines.
     tokens: list[_Token] = []
+    append = tokens.append
 
+    n = len(text)
     i = 0
     line = start_line
     col = start_col
 
-    def advance(n: int = 1) -> None:
-        nonlocal i, line, col
-        for _ in range(n):
-            if i >= len(text):
-                return
-            ch = text[i]
-            i += 1
-            if ch == "\n":
-                line += 1
-                col = 1
-            else:
-                col += 1
-
     def make_span(
         start_line_: int,
         start_col_: int,
@@ -155,115 +163,116 @@ def _tokenize(
             end_col=end_col_,
         )
 
-    while i < len(text):
+    while i < n:
         ch = text[i]
 
         # Whitespace
         if ch.isspace():
-            advance(1)
+            j = i + 1
+            while j < n and text[j].isspace():
+                j += 1
+            newlines = text.count("\n", i, j)
+            if newlines:
+                line += newlines
+                col = j - text.rfind("\n", i, j)
+            else:
+                col += j - i
+            i = j
             continue
 
         # Two-char operators
-        if text.startswith("!=", i):
-            s_line, s_col = line, col
-            advance(2)
-            tokens.append(_Token("NE", "!=", make_span(s_line, s_col, line, col - 1)))
-            continue
-        if text.startswith("<=", i):
-            s_line, s_col = line, col
-            advance(2)
-            tokens.append(_Token("LE", "<=", make_span(s_line, s_col, line, col - 1)))
-            continue
-        if text.startswith(">=", i):
-            s_line, s_col = line, col
-            advance(2)
-            tokens.append(_Token("GE", ">=", make_span(s_line, s_col, line, col - 1)))
+        two = _TWO_CHAR_TOKENS.get(text[i : i + 2])
+        if two is not None:
+            append(_Token(two, text[i : i + 2], make_span(line, col, line, col + 1)))
+            i += 2
+            col += 2
             continue
 
         # Single char punctuation/operators
         kind = _SIMPLE_TOKENS.get(ch)
         if kind is not None:
-            s_line, s_col = line, col
-            advance(1)
-            tokens.append(_Token(kind, ch, make_span(s_line, s_col, line, col - 1)))
+            append(_Token(kind, ch, make_span(line, col, line, col)))
+            i += 1
+            col += 1
             continue
 
         # String literal: "..." (minimal escapes for \" and \\)
         if ch == '"':
             s_line, s_col = line, col
-            advance(1)  # opening quote
             buf: list[str] = []
-            while i < len(text):
-                c = text[i]
+            j = i + 1  # after opening quote
+            while j < n:
+                c = text[j]
                 if c == '"':
-                    advance(1)
-                    span = make_span(s_line, s_col, line, col - 1)
-                    tokens.append(_Token("STRING", "".join(buf), span))
+                    j += 1
                     break
                 if c == "\\":
-                    # Escape
-                    if i + 1 >= len(text):
+                    # Escape: keep the next char literally (covers \" and \\).
+                    if j + 1 >= n:
                         raise _ParseError(
                             "Unterminated string literal", line=s_line, col=s_col
                         )
-                    nxt = text[i + 1]
-                    if nxt in {'"', "\\"}:
-                        buf.append(nxt)
-                        advance(2)
-                        continue
-                    # Unknown escape: keep literal next char.
-                    buf.append(nxt)
-                    advance(2)
+                    buf.append(text[j + 1])
+                    j += 2
                     continue
-
                 buf.append(c)
-                advance(1)
+                j += 1
             else:
                 raise _ParseError("Unterminated string literal", line=s_line, col=s_col)
+
+            newlines = text.count("\n", i, j)
+            if newlines:
+                line += newlines
+                col = j - text.rfind("\n", i, j)
+            else:
+                col += j - i
+            i = j
+            append(
+                _Token("STRING", "".join(buf), make_span(s_line, s_col, line, col - 1))
+            )
             continue
 
         # Number: int or real
         if ch.isdigit():
-            s_line, s_col = line, col
-            start_i = i
-            while i < len(text) and text[i].isdigit():
-                advance(1)
+            j = i + 1
+            while j < n and text[j].isdigit():
+                j += 1
             is_real = False
-            if i < len(text) and text[i] == ".":
-                # Real requires at least one digit after '.'
-                if i + 1 < len(text) and text[i + 1].isdigit():
-                    is_real = True
-                    advance(1)  # '.'
-                    while i < len(text) and text[i].isdigit():
-                        advance(1)
-            literal = text[start_i:i]
-            span = make_span(s_line, s_col, line, col - 1)
-            tokens.append(_Token("REAL" if is_real else "INT", literal, span))
+            # Real requires at least one digit after '.'
+            if j + 1 < n and text[j] == "." and text[j + 1].isdigit():
+                is_real = True
+                j += 2
+                while j < n and text[j].isdigit():
+                    j += 1
+            end_col = col + (j - i) - 1
+            append(
+                _Token(
+                    "REAL" if is_real else "INT",
+                    text[i:j],
+                    make_span(line, col, line, end_col),
+                )
+            )
+            col = end_col + 1
+            i = j
             continue
 
         # Identifier / keywords
         if ch.isalpha() or ch == "_":
-            s_line, s_col = line, col
-            start_i = i
-            while i < len(text) and (text[i].isalnum() or text[i] == "_"):
-                advance(1)
-            ident = text[start_i:i]
-            span = make_span(s_line, s_col, line, col - 1)
-            kw = ident.casefold()
-            if kw == "and":
-                tokens.append(_Token("AND", ident, span))
-            elif kw == "or":
-                tokens.append(_Token("OR", ident, span))
-            elif kw == "not":
-                tokens.append(_Token("NOT", ident, span))
-            elif kw == "true":
-                tokens.append(_Token("TRUE", ident, span))
-            elif kw == "false":
-                tokens.append(_Token("FALSE", ident, span))
-            elif kw == "null":
-                tokens.append(_Token("NULL", ident, span))
-            else:
-                tokens.append(_Token("IDENT", ident, span))
+            j = i + 1
+            while j < n and (text[j].isalnum() or text[j] == "_"):
+                j += 1
+            # Rule expressions repeat the same few names; share one string each.
+            ident = sys.intern(text[i:j])
+            end_col = col + (j - i) - 1
+            append(
+                _Token(
+                    _KEYWORDS.get(ident.casefold(), "IDENT"),
+                    ident,
+                    make_span(line, col, line, end_col),
+                )
+            )
+            col = end_col + 1
+            i = j
             continue
 
         raise _ParseError(f"Unexpected character: {ch!r}", line=line, col=col)
@@ -275,7 +284,7 @@ def _tokenize(
         end_line=line,
         end_col=col,
     )
-    tokens.append(_Token("EOF", "", eof_span))
+    append(_Token("EOF", "", eof_span))
     return tokens
 
 
@@ -303,6 +312,34 @@ def _issue_unexpected(tok: _Token, *, expected: str) -> Issue:
     )
 
 
+# Operator tables, shared by all parser instances instead of being rebuilt
+# on every operator visit.
+_COMPARISON_OPS: dict[str, BinaryOp] = {
+    "EQ": BinaryOp.EQ,
+    "NE": BinaryOp.NE,
+    "LT": BinaryOp.LT,
+    "LE": BinaryOp.LE,
+    "GT": BinaryOp.GT,
+    "GE": BinaryOp.GE,
+}
+
+_ADDITIVE_OPS: dict[str, BinaryOp] = {
+    "PLUS": BinaryOp.ADD,
+    "MINUS": BinaryOp.SUB,
+}
+
+_MULTIPLICATIVE_OPS: dict[str, BinaryOp] = {
+    "STAR": BinaryOp.MUL,
+    "SLASH": BinaryOp.DIV,
+}
+
+_UNARY_OPS: dict[str, UnaryOp] = {
+    "PLUS": UnaryOp.PLUS,
+    "MINUS": UnaryOp.MINUS,
+    "NOT": UnaryOp.NOT,
+}
+
+
 class _Parser:
     def __init__(self, tokens: list[_Token]) -> None:
         self._tokens = tokens
@@ -365,18 +402,10 @@ class _Parser:
     def _parse_comparison(self) -> Expr:
         expr = self._parse_additive()
         while True:
-            tok = self.match("EQ", "NE", "LT", "LE", "GT", "GE")
-            if tok is None:
+            op = _COMPARISON_OPS.get(self.peek().kind)
+            if op is None:
                 break
-
-            op = {
-                "EQ": BinaryOp.EQ,
-                "NE": BinaryOp.NE,
-                "LT": BinaryOp.LT,
-                "LE": BinaryOp.LE,
-                "GT": BinaryOp.GT,
-                "GE": BinaryOp.GE,
-            }[tok.kind]
+            tok = self.advance()
             right = self._parse_additive()
             expr = ExprBinary(
                 left=expr,
@@ -390,10 +419,10 @@ class _Parser:
     def _parse_additive(self) -> Expr:
         expr = self._parse_multiplicative()
         while True:
-            tok = self.match("PLUS", "MINUS")
-            if tok is None:
+            op = _ADDITIVE_OPS.get(self.peek().kind)
+            if op is None:
                 break
-            op = BinaryOp.ADD if tok.kind == "PLUS" else BinaryOp.SUB
+            tok = self.advance()
             right = self._parse_multiplicative()
             expr = ExprBinary(
                 left=expr,
@@ -407,10 +436,10 @@ class _Parser:
     def _parse_multiplicative(self) -> Expr:
         expr = self._parse_unary()
         while True:
-            tok = self.match("STAR", "SLASH")
-            if tok is None:
+            op = _MULTIPLICATIVE_OPS.get(self.peek().kind)
+            if op is None:
                 break
-            op = BinaryOp.MUL if tok.kind == "STAR" else BinaryOp.DIV
+            tok = self.advance()
             right = self._parse_unary()
             expr = ExprBinary(
                 left=expr,
@@ -422,13 +451,9 @@ class _Parser:
         return expr
 
     def _parse_unary(self) -> Expr:
-        tok = self.match("PLUS", "MINUS", "NOT")
-        if tok is not None:
-            op = {
-                "PLUS": UnaryOp.PLUS,
-                "MINUS": UnaryOp.MINUS,
-                "NOT": UnaryOp.NOT,
-            }[tok.kind]
+        op = _UNARY_OPS.get(self.peek().kind)
+        if op is not None:
+            tok = self.advance()
             operand = self._parse_unary()
             return ExprUnary(
                 op=op,
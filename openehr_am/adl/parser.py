@@ -17,6 +17,8 @@ The rules section is captured as raw text + best-effort spans (no parsing/evalua
 # Spec: https://specifications.openehr.org/releases/AM/latest/ADL2.html
 """
 
+import sys
+from bisect import bisect_right
 from dataclasses import dataclass, replace
 from typing import Literal
 
@@ -367,197 +369,174 @@ class _CadlParseError(Exception):
         self.col = col
 
 
+_CADL_SYMBOLS: dict[str, str] = {
+    "{": "LBRACE",
+    "}": "RBRACE",
+    "[": "LBRACK",
+    "]": "RBRACK",
+    "(": "LPAREN",
+    ")": "RPAREN",
+    ",": "COMMA",
+    ";": "SEMI",
+    "*": "STAR",
+}
+
+
 def _tokenize_cadl(chunk: str, *, section_start_line: int) -> list[_Token]:
+    # The scan loop only moves an offset. Line/col are resolved per token
+    # from a table of line-start offsets (built once), instead of being
+    # updated on every character.
     tokens: list[_Token] = []
+    append = tokens.append
+    n = len(chunk)
 
-    line = section_start_line
-    col = 1
-    i = 0
+    line_starts = [0]
+    nl = chunk.find("\n")
+    while nl != -1:
+        line_starts.append(nl + 1)
+        nl = chunk.find("\n", nl + 1)
 
-    def advance(n: int = 1) -> None:
-        nonlocal i, line, col
-        for _ in range(n):
-            if i >= len(chunk):
-                return
-            ch = chunk[i]
-            i += 1
-            if ch == "\n":
-                line += 1
-                col = 1
-            else:
-                col += 1
+    def position(offset: int) -> tuple[int, int]:
+        k = bisect_right(line_starts, offset) - 1
+        return section_start_line + k, offset - line_starts[k] + 1
 
-    while i < len(chunk):
+    def token(kind: str, value: str, start: int, end: int) -> _Token:
+        # `end` is exclusive; tokens never end with a newline.
+        s_line, s_col = position(start)
+        e_line, e_col = position(end - 1)
+        return _Token(kind, value, s_line, s_col, e_line, e_col)
+
+    i = 0
+    while i < n:
         ch = chunk[i]
 
         # Whitespace
         if ch.isspace():
-            advance()
+            i += 1
             continue
 
         # Comment to end of line
-        if ch == "-" and i + 1 < len(chunk) and chunk[i + 1] == "-":
-            while i < len(chunk) and chunk[i] != "\n":
-                advance()
+        if ch == "-" and i + 1 < n and chunk[i + 1] == "-":
+            i = chunk.find("\n", i)
+            if i == -1:
+                i = n
             continue
 
-        start_line, start_col = line, col
-
         # Two-char operator
-        if ch == "." and i + 1 < len(chunk) and chunk[i + 1] == ".":
-            advance(2)
-            tokens.append(_Token("DOTDOT", "..", start_line, start_col, line, col - 1))
+        if ch == "." and i + 1 < n and chunk[i + 1] == ".":
+            append(token("DOTDOT", "..", i, i + 2))
+            i += 2
             continue
 
         # Single-char symbols
-        if ch in "{}[](),;*":
-            advance()
-            kind = {
-                "{": "LBRACE",
-                "}": "RBRACE",
-                "[": "LBRACK",
-                "]": "RBRACK",
-                "(": "LPAREN",
-                ")": "RPAREN",
-                ",": "COMMA",
-                ";": "SEMI",
-                "*": "STAR",
-            }[ch]
-            tokens.append(_Token(kind, ch, start_line, start_col, line, col - 1))
+        kind = _CADL_SYMBOLS.get(ch)
+        if kind is not None:
+            append(token(kind, ch, i, i + 1))
+            i += 1
             continue
 
         # String literal (double quotes)
         if ch == '"':
-            advance()  # opening
+            j = i + 1  # after opening
             value_chars: list[str] = []
-            while i < len(chunk):
-                cur = chunk[i]
-                if cur == "\\" and i + 1 < len(chunk):
+            while j < n:
+                cur = chunk[j]
+                if cur == "\\" and j + 1 < n:
                     # Minimal escape support.
-                    advance()
-                    value_chars.append(chunk[i])
-                    advance()
+                    value_chars.append(chunk[j + 1])
+                    j += 2
                     continue
                 if cur == '"':
                     break
                 value_chars.append(cur)
-                advance()
-            if i >= len(chunk) or chunk[i] != '"':
+                j += 1
+            if j >= n:
+                line, col = position(i)
                 raise _CadlParseError(
-                    message="Unterminated string literal",
-                    line=start_line,
-                    col=start_col,
-                )
-            advance()  # closing
-            tokens.append(
-                _Token(
-                    "STRING",
-                    "".join(value_chars),
-                    start_line,
-                    start_col,
-                    line,
-                    col - 1,
+                    message="Unterminated string literal", line=line, col=col
                 )
-            )
+            append(token("STRING", "".join(value_chars), i, j + 1))
+            i = j + 1
             continue
 
         # Regex literal (/.../)
         if ch == "/":
-            advance()  # opening
+            j = i + 1  # after opening
             value_chars: list[str] = []
             escaped = False
-            while i < len(chunk):
-                cur = chunk[i]
+            while j < n:
+                cur = chunk[j]
                 if cur == "\n":
-                    raise _CadlParseError(
-                        message="Unterminated regex literal",
-                        line=start_line,
-                        col=start_col,
-                    )
+                    break
                 if escaped:
                     value_chars.append(cur)
                     escaped = False
-                    advance()
+                    j += 1
                     continue
                 if cur == "\\":
                     escaped = True
-                    advance()
+                    j += 1
                     continue
                 if cur == "/":
                     break
                 value_chars.append(cur)
-                advance()
-            if i >= len(chunk) or chunk[i] != "/":
+                j += 1
+            if j >= n or chunk[j] != "/":
+                line, col = position(i)
                 raise _CadlParseError(
-                    message="Unterminated regex literal",
-                    line=start_line,
-                    col=start_col,
-                )
-            advance()  # closing
-            tokens.append(
-                _Token(
-                    "REGEX",
-                    "".join(value_chars),
-                    start_line,
-                    start_col,
-                    line,
-                    col - 1,
+                    message="Unterminated regex literal", line=line, col=col
                 )
-            )
+            append(token("REGEX", "".join(value_chars), i, j + 1))
+            i = j + 1
             continue
 
         # Number (int/float)
-        if ch.isdigit() or (
-            ch == "-" and i + 1 < len(chunk) and chunk[i + 1].isdigit()
-        ):
-            num_chars: list[str] = []
-            if ch == "-":
-                num_chars.append("-")
-                advance()
+        if ch.isdigit() or (ch == "-" and i + 1 < n and chunk[i + 1].isdigit()):
+            j = i + 1
             saw_dot = False
-            while i < len(chunk):
-                cur = chunk[i]
+            while j < n:
+                cur = chunk[j]
                 if cur.isdigit():
-                    num_chars.append(cur)
-                    advance()
+                    j += 1
                     continue
                 if (
                     cur == "."
                     and not saw_dot
-                    and not (i + 1 < len(chunk) and chunk[i + 1] == ".")
+                    and not (j + 1 < n and chunk[j + 1] == ".")
                 ):
                     saw_dot = True
-                    num_chars.append(".")
-                    advance()
+                    j += 1
                     continue
                 break
-            tokens.append(
-                _Token(
-                    "NUMBER", "".join(num_chars), start_line, start_col, line, col - 1
-                )
-            )
+            append(token("NUMBER", chunk[i:j], i, j))
+            i = j
             continue
 
         # Identifier / keyword
-        if ch.isalpha() or ch in "_":
-            ident_chars: list[str] = []
-            while i < len(chunk):
-                cur = chunk[i]
+        if ch.isalpha() or ch == "_":
+            j = i + 1
+            while j < n:
+                cur = chunk[j]
                 if cur.isalnum() or cur in "_-.":
-                    ident_chars.append(cur)
-                    advance()
+                    j += 1
                     continue
                 break
-            value = "".join(ident_chars)
+            # RM type/attribute names recur across nodes and archetypes;
+            # interned, they are shared and compare by identity downstream
+            # (path resolution, BMM lookups).
+            value = sys.intern(chunk[i:j])
             kind = "KEYWORD" if value.casefold() in _CADL_KEYWORDS else "IDENT"
-            tokens.append(_Token(kind, value, start_line, start_col, line, col - 1))
+            append(token(kind, value, i, j))
+            i = j
             continue
 
+        line, col = position(i)
         raise _CadlParseError(
             message=f"Unexpected character: {ch!r}", line=line, col=col
         )
 
-    tokens.append(_Token("EOF", "", line, col, line, col))
+    line, col = position(n)
+    append(_Token("EOF", "", line, col, line, col))
     return tokens
 
 
@@ -1081,6 +1060,9 @@ _SECTION_NAMES = {
     "rules",
 }
 
+# Case folding never shortens a string, so longer lines cannot be headers.
+_MAX_SECTION_NAME_LEN = max(map(len, _SECTION_NAMES))
+
 
 def _parse_kind(
     lines: list[str], *, filename: str | None
@@ -1143,7 +1125,10 @@ def _parse_artefact_id(
 def _find_sections(lines: list[str]) -> dict[str, int]:
     out: dict[str, int] = {}
     for idx, raw in enumerate(lines):
-        name = raw.rstrip("\n").strip().casefold()
+        name = raw.strip()
+        if len(name) > _MAX_SECTION_NAME_LEN:
+            continue
+        name = name.casefold()
         if name in _SECTION_NAMES:
             out[name] = idx
     return out
@@ -10,9 +10,11 @@ Responsibilities:
 No semantic validation belongs here.
 """
 
-import importlib
 from typing import Any
 
+from antlr4 import CommonTokenStream, InputStream
+from antlr4.error.ErrorListener import ErrorListener
+
 from openehr_am.validation.issue import Issue, Severity
 from openehr_am.validation.issue_collector import IssueCollector
 
@@ -21,14 +23,13 @@ def _extend_one(collector: IssueCollector, issue: Issue) -> None:
     collector.extend([issue])
 
 
-class IssueCollectingErrorListener:
+class IssueCollectingErrorListener(ErrorListener):
     """ANTLR error listener that records lexer/parser errors as Issues.
 
     Note:
-        We intentionally avoid importing `antlr4` at module import time so the
-        project remains importable/type-checkable in environments that do not
-        have optional runtime dependencies installed. The ANTLR Python runtime
-        accepts listeners via `addErrorListener()` using duck-typing.
+        Only `syntaxError` is overridden. The prediction reports (ambiguity,
+        full-context and context-sensitivity) are not syntax errors, so the
+        no-op implementations inherited from `ErrorListener` apply.
     """
 
     def __init__(
@@ -43,7 +44,7 @@ class IssueCollectingErrorListener:
         self._code = code
         self._file = file
 
-    def syntaxError(  # noqa: N802 (ANTLR API)
+    def syntaxError(
         self,
         recognizer: object,
         offendingSymbol: object | None,
@@ -92,11 +93,6 @@ def construct_lexer_parser(
         Callers typically create a parse entrypoint and then inspect `issues`.
     """
 
-    # Import dynamically to avoid a hard dependency at module import time.
-    antlr4 = importlib.import_module("antlr4")
-    InputStream = getattr(antlr4, "InputStream")
-    CommonTokenStream = getattr(antlr4, "CommonTokenStream")
-
     listener = IssueCollectingErrorListener(issues, code=issue_code, file=file)
 
     lexer = lexer_class(InputStream(text))
@@ -8,6 +8,7 @@ It is intended for debugging, tests, and CLI `--json` style output.
 
 from dataclasses import fields, is_dataclass
 from enum import Enum
+from functools import cache
 from typing import Any
 
 
@@ -24,31 +25,71 @@ def aom_to_dict(value: Any) -> Any:
         back to `repr(value)` for unknown object types.
     """
 
-    if value is None:
-        return None
-
-    if isinstance(value, (str, int, float, bool)):
-        return value
-
-    if isinstance(value, Enum):
-        return value.value
-
-    if isinstance(value, (tuple, list)):
-        return [aom_to_dict(v) for v in value]
-
-    if isinstance(value, dict):
-        out: dict[str, Any] = {}
-        for k in sorted(value.keys(), key=str):
-            out[str(k)] = aom_to_dict(value[k])
-        return out
-
-    if is_dataclass(value):
-        out2: dict[str, Any] = {}
-        for f in fields(value):
-            out2[f.name] = aom_to_dict(getattr(value, f.name))
-        return out2
-
-    return repr(value)
+    # Each stack entry converts one non-scalar value and stores it at
+    # `container[key]`. Containers are created with their keys already in
+    # output order and scalars are converted in place, so the walk needs no
+    # recursion (deep definitions would otherwise hit the limit).
+    result: list[Any] = [None]
+    stack: list[tuple[Any, Any, Any]] = [(value, result, 0)]
+    push = stack.append
+
+    while stack:
+        item, container, key = stack.pop()
+
+        if isinstance(item, (tuple, list)):
+            items: list[Any] = [None] * len(item)
+            container[key] = items
+            for i, v in enumerate(item):
+                if v is None or isinstance(v, (str, int, float)):
+                    items[i] = v
+                elif isinstance(v, Enum):
+                    items[i] = v.value
+                else:
+                    push((v, items, i))
+            continue
+
+        if isinstance(item, dict):
+            # Keys are inserted in sorted order; a repeated `str(k)` keeps the
+            # last value, as plain assignment would.
+            mapping = {str(k): item[k] for k in sorted(item.keys(), key=str)}
+            container[key] = mapping
+            for k, v in list(mapping.items()):
+                if v is None or isinstance(v, (str, int, float)):
+                    continue
+                if isinstance(v, Enum):
+                    mapping[k] = v.value
+                else:
+                    push((v, mapping, k))
+            continue
+
+        if is_dataclass(item):
+            obj: dict[str, Any] = {}
+            container[key] = obj
+            for name in _field_names(item if isinstance(item, type) else type(item)):
+                v = getattr(item, name)
+                if v is None or isinstance(v, (str, int, float)):
+                    obj[name] = v
+                elif isinstance(v, Enum):
+                    obj[name] = v.value
+                else:
+                    obj[name] = None
+                    push((v, obj, name))
+            continue
+
+        if item is None or isinstance(item, (str, int, float)):
+            container[key] = item
+        elif isinstance(item, Enum):
+            container[key] = item.value
+        else:
+            container[key] = repr(item)
+
+    return result[0]
+
+
+@cache
+def _field_names(cls: type) -> tuple[str, ...]:
+    # `fields()` rebuilds its result on every call; the names never change.
+    return tuple(f.name for f in fields(cls))
 
 
 __all__ = ["aom_to_dict"]
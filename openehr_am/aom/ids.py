@@ -44,22 +44,19 @@ class NodeId:
 def is_node_id(value: str) -> bool:
     """Return True if value matches `atNNNN` or `acNNNN` (exactly 4 digits)."""
 
-    parsed = try_parse_node_id(value)
-    return parsed is not None
+    return _node_id_prefix(value) is not None
 
 
 def is_at_code(value: str) -> bool:
     """Return True if value matches `atNNNN` (exactly 4 digits)."""
 
-    parsed = try_parse_node_id(value)
-    return parsed is not None and parsed.prefix == "at"
+    return _node_id_prefix(value) == "at"
 
 
 def is_ac_code(value: str) -> bool:
     """Return True if value matches `acNNNN` (exactly 4 digits)."""
 
-    parsed = try_parse_node_id(value)
-    return parsed is not None and parsed.prefix == "ac"
+    return _node_id_prefix(value) == "ac"
 
 
 def try_parse_node_id(value: str) -> NodeId | None:
@@ -69,18 +66,26 @@ def try_parse_node_id(value: str) -> NodeId | None:
         A `NodeId` on success, or `None` if the format is invalid.
     """
 
+    prefix = _node_id_prefix(value)
+    if prefix is None:
+        return None
+
+    return NodeId(prefix=prefix, number=int(value[2:]))
+
+
+def _node_id_prefix(value: str) -> NodeIdPrefix | None:
+    # Shared by the predicates so they don't allocate a NodeId per call.
     if len(value) != 6:
         return None
 
     prefix = value[:2]
-    if prefix not in ("at", "ac"):
+    if prefix != "at" and prefix != "ac":
         return None
 
-    digits = value[2:]
-    if not digits.isdigit():
+    if not value[2:].isdigit():
         return None
 
-    return NodeId(prefix=prefix, number=int(digits))
+    return prefix
 
 
 def format_node_id(prefix: NodeIdPrefix, number: int) -> str:
@@ -132,6 +137,30 @@ def try_parse_archetype_id(value: str) -> ArchetypeId | None:
         `ArchetypeId` on success, else `None`.
     """
 
+    split = _split_archetype_id(value)
+    if split is None:
+        return None
+
+    originator, rm_name, rm_entity, concept, version = split
+    return ArchetypeId(
+        raw=value,
+        originator=originator,
+        rm_name=rm_name,
+        rm_entity=rm_entity,
+        concept=concept,
+        version=version,
+    )
+
+
+def is_archetype_id(value: str) -> bool:
+    """Return True if value parses as an openEHR archetype id (minimal rules)."""
+
+    return _split_archetype_id(value) is not None
+
+
+def _split_archetype_id(value: str) -> tuple[str, str, str, str, str] | None:
+    # (originator, rm_name, rm_entity, concept, version), or None if invalid.
+    # Shared by the predicate so it doesn't allocate an ArchetypeId per call.
     parts = value.split(".")
     if len(parts) < 3:
         return None
@@ -169,49 +198,15 @@ def try_parse_archetype_id(value: str) -> ArchetypeId | None:
     if not _is_version_token(version):
         return None
 
-    return ArchetypeId(
-        raw=value,
-        originator=originator,
-        rm_name=rm_name,
-        rm_entity=rm_entity,
-        concept=concept,
-        version=version,
-    )
-
-
-def is_archetype_id(value: str) -> bool:
-    """Return True if value parses as an openEHR archetype id (minimal rules)."""
-
-    return try_parse_archetype_id(value) is not None
+    return originator, rm_name, rm_entity, concept, version
 
 
 def _is_version_token(value: str) -> bool:
-    # Accept vN, vN.N, vN.N.N, ... (no regex).
-    if len(value) < 2:
-        return False
-    if value[0] != "v":
+    # Accept vN, vN.N, vN.N.N, ... (no regex): every dot-separated part after
+    # the "v" must be a non-empty run of digits.
+    if value[:1] != "v":
         return False
-
-    digits_and_dots = value[1:]
-    if digits_and_dots[0] == "." or digits_and_dots[-1] == ".":
-        return False
-
-    saw_digit = False
-    last_was_dot = False
-
-    for ch in digits_and_dots:
-        if ch.isdigit():
-            saw_digit = True
-            last_was_dot = False
-            continue
-        if ch == ".":
-            if last_was_dot:
-                return False
-            last_was_dot = True
-            continue
-        return False
-
-    return saw_digit and not last_was_dot
+    return all(part.isdigit() for part in value[1:].split("."))
 
 
 __all__ = [
@@ -8,11 +8,15 @@ Notes:
     - Invalid `.adl` contents never raise; problems are returned as `Issue`s.
     - I/O errors for individual files are reported as `Issue`s and skipped.
     - The scan order is deterministic (sorted `Path.rglob`).
+    - Files with identical contents are parsed once per load; later copies
+      reuse the first result (with Issues relocated to their own file).
+    - Parsing can optionally be spread over worker processes.
 
 # Spec: https://specifications.openehr.org/releases/AM/latest/ADL2.html
 """
 
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
 from pathlib import Path
 from typing import Self
 
@@ -31,9 +35,17 @@ class ArchetypeRepository:
     _source: dict[str, str]
 
     @classmethod
-    def load_from_dir(cls, directory: str | Path) -> tuple[Self, list[Issue]]:
+    def load_from_dir(
+        cls, directory: str | Path, *, max_workers: int | None = None
+    ) -> tuple[Self, list[Issue]]:
         """Load all `.adl` files under `directory` and index archetypes by id.
 
+        Args:
+            directory: Directory to scan.
+            max_workers: If greater than 1, parse files in a process pool of
+                this size. Results are merged in scan order, so the outcome is
+                identical to a sequential load.
+
         Returns:
             `(repo, issues)`.
 
@@ -47,38 +59,64 @@ class ArchetypeRepository:
         if not root.exists() or not root.is_dir():
             raise NotADirectoryError(str(root))
 
-        issues: list[Issue] = []
-        archetypes: list[Archetype] = []
-        index: dict[str, Archetype] = {}
-        source: dict[str, str] = {}
-
+        # Read everything first; a read failure becomes that file's only Issue.
+        files: list[tuple[str, str | Issue]] = []
         for p in sorted(root.rglob("*.adl")):
+            filename = str(p)
             try:
-                text = p.read_text(encoding="utf-8")
+                files.append((filename, p.read_text(encoding="utf-8")))
             except OSError as e:
-                issues.append(
-                    Issue(
-                        code="ADL005",
-                        severity=Severity.ERROR,
-                        message=f"Cannot read input file: {e}",
-                        file=str(p),
+                files.append(
+                    (
+                        filename,
+                        Issue(
+                            code="ADL005",
+                            severity=Severity.ERROR,
+                            message=f"Cannot read input file: {e}",
+                            file=filename,
+                        ),
                     )
                 )
-                continue
 
-            artefact, parse_issues = parse_adl(text, filename=str(p))
-            issues.extend(parse_issues)
-            if artefact is None:
+        # File text -> first filename with that text; each is parsed once.
+        first_files: dict[str, str] = {}
+        for filename, text in files:
+            if isinstance(text, str):
+                first_files.setdefault(text, filename)
+        loaded = _load_archetypes(first_files, max_workers=max_workers)
+
+        issues: list[Issue] = []
+        archetypes: list[Archetype] = []
+        index: dict[str, Archetype] = {}
+        source: dict[str, str] = {}
+
+        for filename, text in files:
+            if isinstance(text, Issue):
+                issues.append(text)
                 continue
 
-            aom_obj, build_issues = build_aom_from_adl(artefact)
-            issues.extend(build_issues)
-            if not isinstance(aom_obj, Archetype):
+            aom_obj, first_issues = loaded[text]
+            archetype_id = aom_obj.archetype_id if aom_obj is not None else None
+            first_filename = first_files[text]
+            if filename == first_filename:
+                file_issues = first_issues
+            else:
+                # Identical contents were already parsed: replay that outcome
+                # for this file instead of parsing and building again.
+                aom_obj = None
+                file_issues = [
+                    replace(i, file=filename) if i.file == first_filename else i
+                    for i in first_issues
+                ]
+
+            issues.extend(file_issues)
+            if archetype_id is None:
                 continue
 
-            archetype_id = aom_obj.archetype_id
+            # A replayed archetype id is always already indexed (by the file
+            # that was parsed first), so it is reported as a duplicate here.
             existing = index.get(archetype_id)
-            if existing is not None:
+            if existing is not None or aom_obj is None:
                 issues.append(
                     Issue(
                         code="AOM242",
@@ -87,13 +125,13 @@ class ArchetypeRepository:
                             f"Duplicate archetype id {archetype_id!r} across ADL files; "
                             f"keeping first definition from {source[archetype_id]!r}"
                         ),
-                        file=str(p),
+                        file=filename,
                     )
                 )
                 continue
 
             index[archetype_id] = aom_obj
-            source[archetype_id] = str(p)
+            source[archetype_id] = filename
             archetypes.append(aom_obj)
 
         return cls(archetypes=tuple(archetypes), _index=index, _source=source), issues
@@ -113,6 +151,49 @@ class ArchetypeRepository:
         return tuple(a.archetype_id for a in self.archetypes)
 
 
+def _load_archetypes(
+    texts: dict[str, str], *, max_workers: int | None
+) -> dict[str, tuple[Archetype | None, list[Issue]]]:
+    """Parse and build each text (keyed to its filename), optionally in parallel."""
+
+    if max_workers is not None and max_workers > 1 and len(texts) > 1:
+        # Parsing is pure Python and CPU-bound; threads would serialise on the GIL.
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(_load_archetype_entry, texts.items(), chunksize=4)
+            return dict(zip(texts, results, strict=True))
+
+    return {
+        text: _load_archetype(text, filename=filename)
+        for text, filename in texts.items()
+    }
+
+
+def _load_archetype_entry(
+    entry: tuple[str, str],
+) -> tuple[Archetype | None, list[Issue]]:
+    # Module-level so worker processes can unpickle it.
+    text, filename = entry
+    return _load_archetype(text, filename=filename)
+
+
+def _load_archetype(
+    text: str, *, filename: str
+) -> tuple[Archetype | None, list[Issue]]:
+    issues: list[Issue] = []
+
+    artefact, parse_issues = parse_adl(text, filename=filename)
+    issues.extend(parse_issues)
+    if artefact is None:
+        return None, issues
+
+    aom_obj, build_issues = build_aom_from_adl(artefact)
+    issues.extend(build_issues)
+    if not isinstance(aom_obj, Archetype):
+        return None, issues
+
+    return aom_obj, issues
+
+
 __all__ = [
     "ArchetypeRepository",
 ]
@@ -55,6 +55,9 @@ def check_aql_syntax(text: str, *, filename: str | None = None) -> list[Issue]:
         issue_code="AQL100",
     )
 
+    # Only syntax errors are needed, so skip building the parse tree.
+    parser.buildParseTrees = False
+
     # Root rule per AqlParser.g4.
     parser.selectQuery()
 
@@ -34,7 +34,7 @@ def render_issues(
         ]
         text = json.dumps(payload, ensure_ascii=False)
         # Print as plain text (no markup/highlighting) while still going through
-        # Rich so record=True captures output for tests.
+        # Rich so the console's file (or record buffer) captures the output.
         # Important: prevent Rich from inserting line wraps, which would break JSON.
         console.print(
             text,
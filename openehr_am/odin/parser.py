@@ -8,6 +8,7 @@ Instead, it returns `Issue` objects.
 # Spec: https://specifications.openehr.org/releases/LANG/latest/odin.html
 """
 
+import re
 from dataclasses import dataclass
 from enum import StrEnum
 
@@ -64,6 +65,16 @@ class _Token:
         )
 
 
+# Single-character tokens (a dict lookup is much cheaper than `_TokKind(ch)`).
+_PUNCTUATION: dict[str, _TokKind] = {k.value: k for k in _TokKind if len(k.value) == 1}
+
+# Runs the lexer consumes in one step. `\s` and `\w` agree with
+# `str.isspace()` and `str.isalnum() or "_"`, which the lexer used per char.
+_WS_AND_COMMENTS_RE = re.compile(r"(?:\s|--[^\n]*)*")
+_IDENT_RE = re.compile(r"\w+")
+_STRING_RUN_RE = re.compile(r'[^"\\]+')
+
+
 @dataclass(slots=True)
 class _Cursor:
     text: str
@@ -91,6 +102,19 @@ class _Cursor:
             self.col += 1
         return ch
 
+    def advance_to(self, end: int) -> str:
+        """Advance over `text[i:end]` in one step and return it."""
+
+        run = self.text[self.i : end]
+        self.i = end
+        last_newline = run.rfind("\n")
+        if last_newline < 0:
+            self.col += len(run)
+        else:
+            self.line += run.count("\n")
+            self.col = len(run) - last_newline
+        return run
+
 
 class _ParseError(Exception):
     def __init__(
@@ -123,9 +147,9 @@ class _Lexer:
         start_line, start_col = self._c.line, self._c.col
 
         # Single-character punctuation.
-        if ch in "<>[]=(),;":
+        kind = _PUNCTUATION.get(ch)
+        if kind is not None:
             self._c.advance()
-            kind = _TokKind(ch)
             return _Token(
                 kind=kind,
                 text=ch,
@@ -153,38 +177,16 @@ class _Lexer:
         )
 
     def _skip_ws_and_comments(self) -> None:
-        while not self._c.eof():
-            ch = self._c.peek()
-            if ch.isspace():
-                self._c.advance()
-                continue
-
-            # Comments start with "--" and run to end-of-line.
-            if ch == "-" and self._peek2() == "--":
-                self._c.advance()
-                self._c.advance()
-                while not self._c.eof() and self._c.peek() != "\n":
-                    self._c.advance()
-                continue
-
-            break
-
-    def _peek2(self) -> str:
-        if self._c.i + 1 >= len(self._c.text):
-            return ""
-        return self._c.text[self._c.i : self._c.i + 2]
+        # Comments start with "--" and run to end-of-line.
+        m = _WS_AND_COMMENTS_RE.match(self._c.text, self._c.i)
+        assert m is not None  # The pattern also matches the empty string.
+        self._c.advance_to(m.end())
 
     def _lex_ident(self) -> _Token:
         start_line, start_col = self._c.line, self._c.col
-        buf: list[str] = []
-        while not self._c.eof():
-            ch = self._c.peek()
-            if ch.isalnum() or ch == "_":
-                buf.append(self._c.advance())
-                continue
-            break
-
-        text = "".join(buf)
+        m = _IDENT_RE.match(self._c.text, self._c.i)
+        assert m is not None  # Called on an alphabetic or "_" character.
+        text = self._c.advance_to(m.end())
         return _Token(
             kind=_TokKind.IDENT,
             text=text,
@@ -200,9 +202,13 @@ class _Lexer:
 
         buf: list[str] = []
         while not self._c.eof():
+            # Take the run up to the next quote or escape in one step.
+            m = _STRING_RUN_RE.match(self._c.text, self._c.i)
+            if m is not None:
+                buf.append(self._c.advance_to(m.end()))
+                continue
+
             ch = self._c.advance()
-            if ch == "":
-                break
             if ch == '"':
                 # End.
                 return _Token(
@@ -238,8 +244,6 @@ class _Lexer:
                             line=self._c.line,
                             col=self._c.col - 1,
                         )
-            else:
-                buf.append(ch)
 
         raise _ParseError("Unterminated string literal", line=start_line, col=start_col)
 
@@ -272,6 +276,12 @@ class _Lexer:
                 buf.append(self._c.advance())
                 if self._c.peek() in "+-":
                     buf.append(self._c.advance())
+                if not self._c.peek().isdigit():
+                    raise _ParseError(
+                        f"Expected exponent digits in number {''.join(buf)!r}",
+                        line=start_line,
+                        col=start_col,
+                    )
                 continue
 
             break
@@ -2,12 +2,18 @@
 
 from openehr_am.path.ast import Path, PathPredicate, PathSegment
 from openehr_am.path.parser import parse_path
-from openehr_am.path.resolver import resolve_path
+from openehr_am.path.resolver import (
+    PathResolutionCache,
+    resolve_path,
+    resolve_path_cached,
+)
 
 __all__ = [
     "Path",
     "PathPredicate",
+    "PathResolutionCache",
     "PathSegment",
     "parse_path",
     "resolve_path",
+    "resolve_path_cached",
 ]
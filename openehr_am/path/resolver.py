@@ -1,6 +1,6 @@
 """Resolve openEHR paths against an AOM constraint tree (subset).
 
-Public entrypoint: :func:`resolve_path`.
+Public entrypoints: :func:`resolve_path` and :func:`resolve_path_cached`.
 
 This module is used by validation rules that need to check whether paths
 referenced in an archetype/template actually point to nodes in the AOM
@@ -20,7 +20,7 @@ On valid syntax but no matching nodes, this emits `PATH910`.
 from collections.abc import Iterable
 
 from openehr_am.aom.constraints import CAttribute, CComplexObject, CObject
-from openehr_am.path.ast import Path
+from openehr_am.path.ast import Path, PathSegment
 from openehr_am.path.parser import parse_path
 from openehr_am.validation.issue import Issue, Severity
 
@@ -63,51 +63,129 @@ def resolve_path(
         raw_text = str(path)
 
     if definition is None:
-        return (), [
-            Issue(
-                code="PATH910",
-                severity=Severity.ERROR,
-                message="Path resolves to no nodes",
-                file=filename,
-                path=raw_text,
-            )
-        ]
+        return (), [_path910(filename=filename, path=raw_text)]
 
     current: tuple[CObject, ...] = (definition,)
 
     for seg in path_ast.segments:
-        next_nodes: list[CObject] = []
+        current = _step(current, seg)
+        if not current:
+            return (), [_path910(filename=filename, path=raw_text)]
 
-        for node in current:
-            if not isinstance(node, CComplexObject):
-                continue
+    return current, []
 
-            attr = _find_attribute(node.attributes, seg.name)
-            if attr is None:
-                continue
 
-            if seg.predicate is None:
-                next_nodes.extend(attr.children)
-                continue
+class PathResolutionCache:
+    """Prefix trie of resolved path segments for one definition tree.
 
-            pred_text = seg.predicate.text
-            for child in attr.children:
-                if child.node_id == pred_text:
-                    next_nodes.append(child)
+    Paths referenced by one artefact (template overlays, exclusions, rule
+    statements) typically share long prefixes. The trie stores the nodes
+    reached after every resolved prefix, so resolving `/a/b/c` after `/a/b/d`
+    only walks the last segment.
 
-        current = tuple(next_nodes)
-        if not current:
-            return (), [
-                Issue(
-                    code="PATH910",
-                    severity=Severity.ERROR,
-                    message="Path resolves to no nodes",
-                    file=filename,
-                    path=raw_text,
-                )
-            ]
+    A cache is bound to a single `definition` and must not be shared between
+    trees.
+    """
 
-    return current, []
+    __slots__ = ("definition", "_parsed", "_root")
+
+    def __init__(self, definition: CComplexObject | None) -> None:
+        self.definition = definition
+        self._parsed: dict[tuple[str, str | None], tuple[Path | None, list[Issue]]] = {}
+        self._root = _TrieNode(() if definition is None else (definition,))
+
+
+class _TrieNode:
+    __slots__ = ("nodes", "children")
+
+    def __init__(self, nodes: tuple[CObject, ...]) -> None:
+        self.nodes = nodes
+        self.children: dict[tuple[str, str | None], _TrieNode] = {}
+
+
+def resolve_path_cached(
+    definition: CComplexObject | None,
+    path: str | Path,
+    *,
+    cache: PathResolutionCache,
+    filename: str | None = None,
+) -> tuple[tuple[CObject, ...] | None, list[Issue]]:
+    """Like :func:`resolve_path`, reusing prefix resolutions stored in `cache`.
+
+    Results (including emitted Issues) are identical to `resolve_path`.
+
+    Raises:
+        ValueError: If `cache` was created for a different definition
+            (programmer error).
+    """
+
+    if cache.definition is not definition:
+        raise ValueError("PathResolutionCache belongs to a different definition")
+
+    if isinstance(path, str):
+        parsed = cache._parsed.get((path, filename))
+        if parsed is None:
+            parsed = parse_path(path, filename=filename)
+            cache._parsed[(path, filename)] = parsed
+        path_ast, parse_issues = parsed
+        if parse_issues:
+            return None, list(parse_issues)
+        assert path_ast is not None
+        raw_text = path
+    else:
+        path_ast = path
+        raw_text = str(path)
+
+    if definition is None:
+        return (), [_path910(filename=filename, path=raw_text)]
+
+    trie = cache._root
+    for seg in path_ast.segments:
+        key = (seg.name, None if seg.predicate is None else seg.predicate.text)
+        child = trie.children.get(key)
+        if child is None:
+            child = _TrieNode(_step(trie.nodes, seg))
+            trie.children[key] = child
+        trie = child
+        if not trie.nodes:
+            return (), [_path910(filename=filename, path=raw_text)]
+
+    return trie.nodes, []
+
+
+def _step(current: tuple[CObject, ...], seg: PathSegment) -> tuple[CObject, ...]:
+    """Follow one path segment from every node in `current`."""
+
+    next_nodes: list[CObject] = []
+
+    for node in current:
+        if not isinstance(node, CComplexObject):
+            continue
+
+        attr = _find_attribute(node.attributes, seg.name)
+        if attr is None:
+            continue
+
+        if seg.predicate is None:
+            next_nodes.extend(attr.children)
+            continue
+
+        pred_text = seg.predicate.text
+        for child in attr.children:
+            if child.node_id == pred_text:
+                next_nodes.append(child)
+
+    return tuple(next_nodes)
+
+
+def _path910(*, filename: str | None, path: str) -> Issue:
+    return Issue(
+        code="PATH910",
+        severity=Severity.ERROR,
+        message="Path resolves to no nodes",
+        file=filename,
+        path=path,
+    )
 
 
 def _find_attribute(attrs: Iterable[CAttribute], name: str) -> CAttribute | None:
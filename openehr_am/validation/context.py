@@ -4,7 +4,7 @@ Validation checks should accept a `ValidationContext` and return an iterable of
 `Issue` objects.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 @dataclass(slots=True, frozen=True)
@@ -19,7 +19,14 @@ class ValidationContext:
     rm_repo:
         Optional RM repository (e.g., a loaded BMM repository) required for RM
         conformance checks.
+    cache:
+        Scratch space shared by the checks of a single validation run.
+
+        Checks may store values derived from `artefact` here (keyed by a
+        stable string) so that sibling checks do not recompute them. The cache
+        lives exactly as long as the context.
     """
 
     artefact: object
     rm_repo: object | None = None
+    cache: dict[str, object] = field(default_factory=dict, compare=False, repr=False)
@@ -25,35 +25,17 @@ def validate_issue_code(code: str) -> bool:
     `docs/issue-codes.md`.
     """
 
-    if not code:
-        return False
-
-    # Split into alpha prefix + 3 digit suffix, without regex.
-    prefix_end = 0
-    for ch in code:
-        if ch.isalpha():
-            prefix_end += 1
-            continue
-        break
-
-    prefix = code[:prefix_end]
-    digits = code[prefix_end:]
-
-    if not prefix or not digits:
-        return False
-
-    if prefix != prefix.upper():
-        return False
-
-    if prefix not in _ISSUE_CODE_RANGES:
-        return False
+    # Every code is a known (uppercase) prefix followed by exactly three ASCII
+    # digits, so the split point is fixed.
+    prefix = code[:-3]
+    digits = code[-3:]
 
-    if len(digits) != 3 or not digits.isdigit():
+    bounds = _ISSUE_CODE_RANGES.get(prefix)
+    if bounds is None or not (digits.isascii() and digits.isdigit()):
         return False
 
-    number = int(digits)
-    low, high = _ISSUE_CODE_RANGES[prefix]
-    return low <= number <= high
+    low, high = bounds
+    return low <= int(digits) <= high
 
 
 class Severity(StrEnum):
@@ -37,8 +37,11 @@ class IssueCollector:
         return tuple(self._issues)
 
     def extend(self, issues: Iterable[Issue]) -> None:
+        n_before = len(self._issues)
         self._issues.extend(issues)
-        self._issues.sort(key=_issue_sort_key)
+        # Most checks report nothing; skip re-sorting when nothing was added.
+        if len(self._issues) != n_before:
+            self._issues.sort(key=_issue_sort_key)
 
     def has_errors(self) -> bool:
         return any(issue.severity == Severity.ERROR for issue in self._issues)
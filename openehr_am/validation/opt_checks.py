@@ -7,8 +7,10 @@ Current scope (MVP): internal consistency checks for `OperationalTemplate`.
 # Spec: https://specifications.openehr.org/releases/AM/latest/OPT2.html
 """
 
+from collections import Counter
 from collections.abc import Iterable
 
+from openehr_am.antlr.span import SourceSpan
 from openehr_am.opt.model import (
     OperationalTemplate,
     OptCAttribute,
@@ -23,17 +25,20 @@ def _opt750(
     *,
     message: str,
     path: str | None = None,
-    span,
+    span: SourceSpan | None,
 ) -> Issue:
+    # Check `span` once rather than once per location field.
+    if span is None:
+        return Issue(code="OPT750", severity=Severity.ERROR, message=message, path=path)
     return Issue(
         code="OPT750",
         severity=Severity.ERROR,
         message=message,
-        file=span.file if span else None,
-        line=span.start_line if span else None,
-        col=span.start_col if span else None,
-        end_line=span.end_line if span else None,
-        end_col=span.end_col if span else None,
+        file=span.file,
+        line=span.start_line,
+        col=span.start_col,
+        end_line=span.end_line,
+        end_col=span.end_col,
         path=path,
     )
 
@@ -53,14 +58,9 @@ def check_opt_integrity(ctx: ValidationContext) -> Iterable[Issue]:
     issues: list[Issue] = []
 
     # Component archetype ids should be unique.
-    seen: set[str] = set()
-    dups: list[str] = []
-    for a_id in opt.component_archetype_ids:
-        if a_id in seen:
-            dups.append(a_id)
-        seen.add(a_id)
-
-    for a_id in sorted(set(dups)):
+    component_counts = Counter(opt.component_archetype_ids)
+
+    for a_id in sorted(a_id for a_id, n in component_counts.items() if n > 1):
         issues.append(
             _opt750(
                 message=f"Duplicate archetype id in component_archetype_ids: {a_id!r}",
@@ -70,7 +70,7 @@ def check_opt_integrity(ctx: ValidationContext) -> Iterable[Issue]:
 
     # Root archetype id should be part of components when both are present.
     if opt.root_archetype_id is not None and opt.component_archetype_ids:
-        if opt.root_archetype_id not in set(opt.component_archetype_ids):
+        if opt.root_archetype_id not in component_counts:
             issues.append(
                 _opt750(
                     message=(
@@ -82,7 +82,7 @@ def check_opt_integrity(ctx: ValidationContext) -> Iterable[Issue]:
             )
 
     if opt.definition is None:
-        return tuple(issues)
+        return issues
 
     # Root definition should have a path and it should start at '/'.
     if opt.definition.path is None or not opt.definition.path.startswith("/"):
@@ -114,16 +114,74 @@ def check_opt_integrity(ctx: ValidationContext) -> Iterable[Issue]:
             )
         )
 
-    return tuple(issues)
+    return issues
 
 
 def _check_object(
-    obj: OptCObject,
+    root: OptCObject,
     *,
     parent_path: str | None,
     issues: list[Issue],
     all_paths: list[str],
 ) -> None:
+    """Check `root` and its subtree in pre-order (explicit stack).
+
+    Each attribute is checked just before its children are visited, matching
+    the order a recursive walk would produce without its depth limit.
+    """
+
+    # Object entries carry their parent's path (if any); attribute entries carry
+    # the owning object's path, which is always known.
+    stack: list[tuple[OptCObject, str | None] | tuple[OptCAttribute, str]] = [
+        (root, parent_path)
+    ]
+    while stack:
+        match stack.pop():
+            case (OptCAttribute() as attr, str() as object_path):
+                _check_attribute(attr, parent_object_path=object_path, issues=issues)
+                continue
+            case (node, parent):
+                path = _check_object_node(node, parent_path=parent, issues=issues)
+
+        if path is None:
+            continue
+
+        all_paths.append(path)
+
+        if not isinstance(node, OptCComplexObject):
+            continue
+
+        # Attributes should have unique names within an object.
+        attr_names = [a.rm_attribute_name for a in node.attributes]
+        duplicate_names: list[str] = []
+        if len(set(attr_names)) != len(attr_names):
+            duplicate_names = [n for n, k in Counter(attr_names).items() if k > 1]
+        for name in sorted(duplicate_names):
+            issues.append(
+                _opt750(
+                    message=f"Duplicate attribute name under object {path!r}: {name!r}",
+                    path=path,
+                    span=node.span,
+                )
+            )
+
+        # Push in reverse so attributes (then their children) pop in order.
+        for attr in reversed(
+            sorted(node.attributes, key=lambda a: a.rm_attribute_name)
+        ):
+            child_parent = attr.path or path
+            stack.extend((child, child_parent) for child in reversed(attr.children))
+            stack.append((attr, path))
+
+
+def _check_object_node(
+    obj: OptCObject,
+    *,
+    parent_path: str | None,
+    issues: list[Issue],
+) -> str | None:
+    """Check one object's own path; return it if its subtree should be walked."""
+
     path = obj.path
     if path is None or not path.startswith("/"):
         issues.append(
@@ -133,7 +191,7 @@ def _check_object(
                 span=obj.span,
             )
         )
-        return
+        return None
 
     if parent_path is not None and not path.startswith(parent_path):
         issues.append(
@@ -156,31 +214,7 @@ def _check_object(
             )
         )
 
-    all_paths.append(path)
-
-    if not isinstance(obj, OptCComplexObject):
-        return
-
-    # Attributes should have unique names within an object.
-    attr_names = [a.rm_attribute_name for a in obj.attributes]
-    for name in sorted({n for n in attr_names if attr_names.count(n) > 1}):
-        issues.append(
-            _opt750(
-                message=f"Duplicate attribute name under object {path!r}: {name!r}",
-                path=path,
-                span=obj.span,
-            )
-        )
-
-    for attr in sorted(obj.attributes, key=lambda a: a.rm_attribute_name):
-        _check_attribute(attr, parent_object_path=path, issues=issues)
-        for child in attr.children:
-            _check_object(
-                child,
-                parent_path=attr.path or path,
-                issues=issues,
-                all_paths=all_paths,
-            )
+    return path
 
 
 def _check_attribute(
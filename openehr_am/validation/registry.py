@@ -75,6 +75,15 @@ class ValidationRegistry:
             raise ValueError(f"Unsupported validation layer: {layer!r}")
 
         check_name = name or getattr(check, "__name__", "<check>")
+        for existing in self._registrations[layer]:
+            if existing.check is check and existing.name == check_name:
+                # Programmer error: the same check would run twice per validation.
+                # Only identity counts, so a reloaded module's new function
+                # objects can still register.
+                raise ValueError(
+                    f"Check {check_name!r} is already registered in layer {layer.value!r}"
+                )
+
         reg = _Registration(
             layer=layer,
             name=check_name,
@@ -94,6 +103,8 @@ class ValidationRegistry:
         """Run checks for the given layers and return deterministically-ordered Issues."""
 
         selected_layers = self._select_layers(layers)
+        if not any(self._registrations[layer] for layer in selected_layers):
+            return ()
 
         collector = IssueCollector()
         for layer in selected_layers:
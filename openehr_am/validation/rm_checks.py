@@ -6,7 +6,9 @@ Each check in this module should be permissive and return `Issue` objects.
 """
 
 from collections.abc import Iterable
+from typing import cast
 
+from openehr_am.antlr.span import SourceSpan
 from openehr_am.aom.archetype import Archetype, Template
 from openehr_am.aom.constraints import CAttribute, CComplexObject, CObject
 from openehr_am.bmm.repository import ModelRepository
@@ -15,25 +17,82 @@ from openehr_am.validation.issue import Issue, Severity
 from openehr_am.validation.rm import register_rm_check
 
 
+def _issue(
+    code: str,
+    message: str,
+    span: SourceSpan | None,
+    *,
+    node_id: str | None,
+) -> Issue:
+    """Build an ERROR Issue located at `span` (span checked once)."""
+
+    if span is None:
+        return Issue(
+            code=code, severity=Severity.ERROR, message=message, node_id=node_id
+        )
+    return Issue(
+        code=code,
+        severity=Severity.ERROR,
+        message=message,
+        file=span.file,
+        line=span.start_line,
+        col=span.start_col,
+        end_line=span.end_line,
+        end_col=span.end_col,
+        node_id=node_id,
+    )
+
+
 def _is_builtin_rm_type(name: str) -> bool:
     # Minimal set for primitive constraints.
     return name in {"String", "Integer", "Real", "Boolean"}
 
 
 def _iter_cobjects(root: CObject) -> Iterable[CObject]:
-    yield root
-    if isinstance(root, CComplexObject):
-        for attr in root.attributes:
-            for child in attr.children:
-                yield from _iter_cobjects(child)
+    # Pre-order walk with an explicit stack (no recursion limit on deep trees).
+    stack: list[CObject] = [root]
+    while stack:
+        obj = stack.pop()
+        yield obj
+        if isinstance(obj, CComplexObject):
+            for attr in reversed(obj.attributes):
+                stack.extend(reversed(attr.children))
 
 
 def _iter_attributes(root: CObject) -> Iterable[tuple[CObject, CAttribute]]:
+    # Same order as a recursive walk: each attribute, then its subtrees.
+    stack: list[tuple[CObject, CAttribute]] = []
     if isinstance(root, CComplexObject):
-        for attr in root.attributes:
-            yield root, attr
-            for child in attr.children:
-                yield from _iter_attributes(child)
+        stack.extend((root, attr) for attr in reversed(root.attributes))
+    while stack:
+        parent, attr = stack.pop()
+        yield parent, attr
+        for child in reversed(attr.children):
+            if isinstance(child, CComplexObject):
+                stack.extend((child, a) for a in reversed(child.attributes))
+
+
+def _extract_root(artefact: object) -> CObject | None:
+    if isinstance(artefact, (Archetype, Template)):
+        return artefact.definition
+    if isinstance(artefact, CComplexObject):
+        return artefact
+    return None
+
+
+def _attribute_pairs(
+    ctx: ValidationContext, root: CObject
+) -> tuple[tuple[CObject, CAttribute], ...]:
+    """Return `(parent, attribute)` pairs under `root`, walked once per `ctx`.
+
+    BMM510 and BMM520 both visit every attribute; they share this list.
+    """
+
+    cached = ctx.cache.get("rm.attribute_pairs")
+    if cached is None:
+        cached = tuple(_iter_attributes(root))
+        ctx.cache["rm.attribute_pairs"] = cached
+    return cast(tuple[tuple[CObject, CAttribute], ...], cached)
 
 
 def check_rm_types_exist(ctx: ValidationContext) -> Iterable[Issue]:
@@ -51,17 +110,7 @@ def check_rm_types_exist(ctx: ValidationContext) -> Iterable[Issue]:
     if not isinstance(ctx.rm_repo, ModelRepository):
         raise TypeError("RM validation requires rm_repo to be a ModelRepository")
 
-    root = None
-    match ctx.artefact:
-        case Archetype(definition=definition):
-            root = definition
-        case Template(definition=definition):
-            root = definition
-        case CComplexObject() as definition:
-            root = definition
-        case _:
-            return ()
-
+    root = _extract_root(ctx.artefact)
     if root is None:
         return ()
 
@@ -72,22 +121,15 @@ def check_rm_types_exist(ctx: ValidationContext) -> Iterable[Issue]:
             continue
         if ctx.rm_repo.get_class(rm_type) is not None:
             continue
-
-        span = node.span
         issues.append(
-            Issue(
-                code="BMM500",
-                severity=Severity.ERROR,
-                message=f"Unknown RM type referenced: {rm_type!r}",
-                file=span.file if span else None,
-                line=span.start_line if span else None,
-                col=span.start_col if span else None,
-                end_line=span.end_line if span else None,
-                end_col=span.end_col if span else None,
+            _issue(
+                "BMM500",
+                f"Unknown RM type referenced: {rm_type!r}",
+                node.span,
                 node_id=node.node_id,
             )
         )
-    return tuple(issues)
+    return issues
 
 
 def _check_attribute_exists(
@@ -104,21 +146,14 @@ def _check_attribute_exists(
 
     if repo.get_property_inherited(rm_type, attr.rm_attribute_name) is not None:
         return
-
-    span = attr.span
     issues.append(
-        Issue(
-            code="BMM510",
-            severity=Severity.ERROR,
-            message=(
+        _issue(
+            "BMM510",
+            (
                 f"Unknown RM attribute referenced: {attr.rm_attribute_name!r} "
                 f"on type {rm_type!r}"
             ),
-            file=span.file if span else None,
-            line=span.start_line if span else None,
-            col=span.start_col if span else None,
-            end_line=span.end_line if span else None,
-            end_col=span.end_col if span else None,
+            attr.span,
             node_id=parent.node_id,
         )
     )
@@ -142,24 +177,14 @@ def check_rm_attributes_exist(ctx: ValidationContext) -> Iterable[Issue]:
     if not isinstance(ctx.rm_repo, ModelRepository):
         raise TypeError("RM validation requires rm_repo to be a ModelRepository")
 
-    root = None
-    match ctx.artefact:
-        case Archetype(definition=definition):
-            root = definition
-        case Template(definition=definition):
-            root = definition
-        case CComplexObject() as definition:
-            root = definition
-        case _:
-            return ()
-
+    root = _extract_root(ctx.artefact)
     if root is None:
         return ()
 
     issues: list[Issue] = []
-    for parent, attr in _iter_attributes(root):
+    for parent, attr in _attribute_pairs(ctx, root):
         _check_attribute_exists(parent, attr, ctx.rm_repo, issues)
-    return tuple(issues)
+    return issues
 
 
 register_rm_check(check_rm_attributes_exist, name="rm_attributes_exist")
@@ -218,22 +243,12 @@ def check_rm_multiplicity_within_rm(ctx: ValidationContext) -> Iterable[Issue]:
     if not isinstance(ctx.rm_repo, ModelRepository):
         raise TypeError("RM validation requires rm_repo to be a ModelRepository")
 
-    root = None
-    match ctx.artefact:
-        case Archetype(definition=definition):
-            root = definition
-        case Template(definition=definition):
-            root = definition
-        case CComplexObject() as definition:
-            root = definition
-        case _:
-            return ()
-
+    root = _extract_root(ctx.artefact)
     if root is None:
         return ()
 
     issues: list[Issue] = []
-    for parent, attr in _iter_attributes(root):
+    for parent, attr in _attribute_pairs(ctx, root):
         rm_type = parent.rm_type_name
         if _is_builtin_rm_type(rm_type) or ctx.rm_repo.get_class(rm_type) is None:
             continue
@@ -252,27 +267,21 @@ def check_rm_multiplicity_within_rm(ctx: ValidationContext) -> Iterable[Issue]:
         rm_upper = rm_prop.multiplicity.upper
 
         if aom_lower < rm_lower or _upper_exceeds(aom_upper, rm_upper):
-            span = attr.span
             issues.append(
-                Issue(
-                    code="BMM520",
-                    severity=Severity.ERROR,
-                    message=(
+                _issue(
+                    "BMM520",
+                    (
                         "Multiplicity mismatch for RM attribute "
                         f"{attr.rm_attribute_name!r} on type {rm_type!r}: "
                         f"AOM allows {aom_lower}..{aom_upper if aom_upper is not None else '*'}, "
                         f"RM allows {rm_lower}..{rm_upper if rm_upper is not None else '*'}"
                     ),
-                    file=span.file if span else None,
-                    line=span.start_line if span else None,
-                    col=span.start_col if span else None,
-                    end_line=span.end_line if span else None,
-                    end_col=span.end_col if span else None,
+                    attr.span,
                     node_id=parent.node_id,
                 )
             )
 
-    return tuple(issues)
+    return issues
 
 
 register_rm_check(check_rm_multiplicity_within_rm, name="rm_multiplicity_within_rm")
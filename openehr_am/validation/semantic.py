@@ -5,9 +5,18 @@ This module provides a small registry for semantic checks.
 Checks registered here are executed using the shared `ValidationRegistry`
 infrastructure, but restricted to the `semantic` layer.
 
+The built-in checks live in `openehr_am.validation.semantic_checks`, which
+registers them into DEFAULT_REGISTRY on import. `validate_semantic` imports it
+on first use; callers running DEFAULT_REGISTRY directly should import it first.
+
 # Spec: https://specifications.openehr.org/releases/AM/latest/AOM2.html
 """
 
+import importlib
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
 from openehr_am.validation.context import ValidationContext
 from openehr_am.validation.issue import Issue
 from openehr_am.validation.registry import (
@@ -18,6 +27,14 @@ from openehr_am.validation.registry import (
 
 DEFAULT_REGISTRY = ValidationRegistry()
 
+# The registry `semantic_checks` registers the default checks into on import.
+# Kept separately so that monkeypatching DEFAULT_REGISTRY never redirects the
+# built-in registrations.
+_BUILTIN_REGISTRY = DEFAULT_REGISTRY
+
+# Set once `semantic_checks` has been imported (see `validate_semantic`).
+_default_checks_loaded = False
+
 
 def register_semantic_check(
     check: ValidationCheck,
@@ -54,15 +71,56 @@ def validate_semantic(
         Tuple of Issues, deterministically ordered.
     """
 
-    ctx = ValidationContext(artefact=aom_obj)
     runner = registry or DEFAULT_REGISTRY
+    if runner is _BUILTIN_REGISTRY and not _default_checks_loaded:
+        _load_default_checks()
+
+    ctx = ValidationContext(artefact=aom_obj)
     return runner.run(ctx, layers=[ValidationLayer.SEMANTIC])
 
 
-# Import default semantic checks (registers into DEFAULT_REGISTRY).
-#
-# This keeps `validate_semantic()` useful out of the box, while still allowing
-# tests to monkeypatch DEFAULT_REGISTRY for isolation.
-import openehr_am.validation.semantic_checks as _semantic_checks  # noqa: E402
+def validate_semantic_batch(
+    aom_objs: Iterable[object],
+    *,
+    max_workers: int | None = None,
+    registry: ValidationRegistry | None = None,
+) -> list[tuple[Issue, ...]]:
+    """Run semantic checks for many AOM objects.
+
+    Each artefact is validated independently with its own context. Results are
+    returned in input order, and the Issues for each artefact are ordered
+    exactly as `validate_semantic` would order them.
+
+    Args:
+        aom_objs: The semantic (AOM) objects to validate.
+        max_workers: If greater than 1, validate on a thread pool of this
+            size. The default is serial: the built-in checks are pure Python
+            and hold the GIL, so threads only pay off on free-threaded builds
+            or with custom checks that release it.
+        registry: Optional registry to use (defaults to DEFAULT_REGISTRY).
+
+    Returns:
+        One tuple of Issues per input object, in input order.
+    """
+
+    runner = registry or DEFAULT_REGISTRY
+    validate = partial(validate_semantic, registry=runner)
+    if max_workers is not None and max_workers > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(validate, aom_objs))
+
+    return [validate(aom_obj) for aom_obj in aom_objs]
+
+
+def _load_default_checks() -> None:
+    """Import the default semantic checks (registers into `_BUILTIN_REGISTRY`).
+
+    The import is deferred until the built-in registry is first used, so
+    callers that validate with their own registry do not pay for importing the
+    AOM model and path resolver. Python's import lock makes concurrent calls
+    safe; the module body runs once.
+    """
 
-del _semantic_checks
+    global _default_checks_loaded
+    importlib.import_module("openehr_am.validation.semantic_checks")
+    _default_checks_loaded = True
@@ -1,12 +1,17 @@
 """Default semantic validation checks.
 
 Checks in this module are registered into the semantic DEFAULT_REGISTRY on
-import.
+import. `openehr_am.validation.semantic` imports this module lazily, the first
+time `validate_semantic` uses the default registry.
 
 # Spec: https://specifications.openehr.org/releases/AM/latest/AOM2.html#_archetype_terminology_class
 """
 
+import re
 from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import cast
 
 from openehr_am.antlr.span import SourceSpan
 from openehr_am.aom.archetype import Archetype, Template
@@ -19,57 +24,304 @@ from openehr_am.aom.constraints import (
     PrimitiveIntegerConstraint,
     PrimitiveRealConstraint,
 )
-from openehr_am.aom.ids import try_parse_node_id
 from openehr_am.aom.terminology import ArchetypeTerminology
-from openehr_am.path.resolver import resolve_path
+from openehr_am.path.resolver import PathResolutionCache, resolve_path_cached
 from openehr_am.validation.context import ValidationContext
 from openehr_am.validation.issue import Issue, Severity
-from openehr_am.validation.semantic import register_semantic_check
+from openehr_am.validation.semantic import _BUILTIN_REGISTRY, register_semantic_check
 
+type _SpanFields = tuple[str | None, int | None, int | None, int | None, int | None]
+
+_NO_SPAN_FIELDS: _SpanFields = (None, None, None, None, None)
+
+
+def _span_fields(span: SourceSpan | None) -> _SpanFields:
+    """Return `(file, line, col, end_line, end_col)` for an Issue at `span`."""
 
-def _span_key(span: SourceSpan | None) -> tuple[object, ...]:
-    # Mirror IssueCollector ordering as closely as possible.
     if span is None:
-        return (True, "", True, 0, True, 0)
-    return (
-        span.file is None,
-        span.file or "",
-        False,
-        span.start_line,
-        False,
-        span.start_col,
+        return _NO_SPAN_FIELDS
+    return (span.file, span.start_line, span.start_col, span.end_line, span.end_col)
+
+
+def _issue(
+    code: str,
+    severity: Severity,
+    message: str,
+    span: SourceSpan | None,
+    *,
+    path: str | None = None,
+    node_id: str | None = None,
+) -> Issue:
+    """Build an Issue located at `span`.
+
+    Callers emitting several issues at the same span should hoist
+    `_span_fields()` and use `_issue_at()` instead.
+    """
+
+    return _issue_at(
+        code, severity, message, _span_fields(span), path=path, node_id=node_id
     )
 
 
-def _iter_cobject_tree(root: CObject) -> Iterator[CObject]:
-    yield root
-    if isinstance(root, CComplexObject):
-        for attr in root.attributes:
-            yield from _iter_cattribute(attr)
+def _issue_at(
+    code: str,
+    severity: Severity,
+    message: str,
+    fields: _SpanFields,
+    *,
+    path: str | None = None,
+    node_id: str | None = None,
+) -> Issue:
+    """Build an Issue from pre-extracted `_span_fields()`."""
+
+    file, line, col, end_line, end_col = fields
+    return Issue(
+        code=code,
+        severity=severity,
+        message=message,
+        file=file,
+        line=line,
+        col=col,
+        end_line=end_line,
+        end_col=end_col,
+        path=path,
+        node_id=node_id,
+    )
+
 
+# Primitive constraints that carry an `interval` (checked by AOM250).
+_INTERVAL_CONSTRAINT_TYPES = (PrimitiveIntegerConstraint, PrimitiveRealConstraint)
 
-def _iter_cattribute(attr: CAttribute) -> Iterator[CObject]:
-    for child in attr.children:
-        yield from _iter_cobject_tree(child)
+_DEFINITION_PATH = "/definition"
 
 
-def _iter_referenced_node_ids(
+@dataclass(slots=True, frozen=True)
+class _PathSegment:
+    """One attribute step of a definition path, linked to its parent step.
+
+    The walk extends paths in O(1) per attribute; the string form is only
+    built (by `_render_path`) for paths that end up in an Issue.
+    """
+
+    parent: _PathSegment | None
+    name: str
+
+
+def _render_path(segment: _PathSegment | None) -> str:
+    names: list[str] = []
+    while segment is not None:
+        names.append(segment.name)
+        segment = segment.parent
+    if not names:
+        return _DEFINITION_PATH
+    names.append(_DEFINITION_PATH)
+    return "/".join(reversed(names))
+
+
+@dataclass(slots=True, frozen=True)
+class _DefinitionFacts:
+    """Per-node facts gathered in a single walk over an artefact definition.
+
+    Attributes:
+        node_ids: (node_id, span) of every CObject carrying a node id.
+        intervals: (interval, owner segment, path suffix, owner node_id) for
+            occurrences, cardinalities and primitive integer/real constraint
+            intervals with both bounds set (half-open intervals cannot break
+            AOM250).
+        duplicate_attributes: (attribute, attribute segment, owner node_id)
+            for attributes whose name repeats within the same CComplexObject.
+        duplicate_children: (child, attribute segment) for children whose
+            node id repeats within the same attribute.
+
+    Paths are kept as `_PathSegment` chains; checks render them with
+    `_render_path` only for facts that produce an Issue.
+    """
+
+    node_ids: tuple[tuple[str, SourceSpan | None], ...] = ()
+    intervals: tuple[tuple[Interval, _PathSegment | None, str, str | None], ...] = ()
+    duplicate_attributes: tuple[tuple[CAttribute, _PathSegment, str | None], ...] = ()
+    duplicate_children: tuple[tuple[CObject, _PathSegment], ...] = ()
+
+
+def _walk_definition(root: CObject) -> _DefinitionFacts:
+    """Collect `_DefinitionFacts` in one pre-order walk (explicit stack).
+
+    Facts are recorded in the order a recursive walk would record them: each
+    attribute's facts directly before its children's subtrees, and a repeated
+    child node id directly before that child's subtree. Issues with equal sort
+    keys (e.g. span-less ones) keep that order.
+    """
+
+    node_ids: list[tuple[str, SourceSpan | None]] = []
+    intervals: list[tuple[Interval, _PathSegment | None, str, str | None]] = []
+    duplicate_attributes: list[tuple[CAttribute, _PathSegment, str | None]] = []
+    duplicate_children: list[tuple[CObject, _PathSegment]] = []
+
+    # Entries: (CObject, segment, None, repeats a sibling's node id) or
+    # (CAttribute, its segment, owner node_id, repeats a sibling's name).
+    stack: list[tuple[CObject | CAttribute, _PathSegment | None, str | None, bool]] = [
+        (root, None, None, False)
+    ]
+    while stack:
+        item, segment, owner_node_id, repeated = stack.pop()
+
+        if isinstance(item, CAttribute):
+            if repeated and segment is not None:
+                duplicate_attributes.append((item, segment, owner_node_id))
+
+            if item.cardinality is not None:
+                occ = item.cardinality.occurrences
+                if occ.lower is not None and occ.upper is not None:
+                    intervals.append((occ, segment, "cardinality", owner_node_id))
+
+            children = item.children
+            repeated_children: list[bool] | None = None
+            if len(children) > 1:
+                child_ids = [c.node_id for c in children if c.node_id is not None]
+                if len(set(child_ids)) != len(child_ids):
+                    repeated_children = []
+                    seen_child_node_ids: set[str] = set()
+                    for child in children:
+                        child_node_id = child.node_id
+                        if child_node_id is None:
+                            repeated_children.append(False)
+                            continue
+                        # A set that does not grow on add() has seen the value.
+                        n_seen = len(seen_child_node_ids)
+                        seen_child_node_ids.add(child_node_id)
+                        repeated_children.append(len(seen_child_node_ids) == n_seen)
+
+            # Reverse so children are popped (visited) in declaration order.
+            if repeated_children is None:
+                stack.extend(
+                    [(child, segment, None, False) for child in reversed(children)]
+                )
+            else:
+                stack.extend(
+                    [
+                        (child, segment, None, flag)
+                        for child, flag in zip(
+                            reversed(children), reversed(repeated_children)
+                        )
+                    ]
+                )
+            continue
+
+        obj = item
+        node_id = obj.node_id
+
+        if repeated and segment is not None:
+            duplicate_children.append((obj, segment))
+
+        if node_id is not None:
+            node_ids.append((node_id, obj.span))
+
+        occ = obj.occurrences
+        if occ is not None and occ.lower is not None and occ.upper is not None:
+            intervals.append((occ, segment, "occurrences", node_id))
+
+        if isinstance(obj, CComplexObject):
+            attributes = obj.attributes
+            # Fast path: most objects have distinct attribute names, so only
+            # track seen names once a duplicate is known to exist.
+            repeated_attrs: list[bool] | None = None
+            if len(attributes) > 1:
+                names = [a.rm_attribute_name for a in attributes]
+                if len(set(names)) != len(names):
+                    seen_attr_names: set[str] = set()
+                    repeated_attrs = []
+                    for name in names:
+                        n_seen = len(seen_attr_names)
+                        seen_attr_names.add(name)
+                        repeated_attrs.append(len(seen_attr_names) == n_seen)
+
+            # Reverse so attributes are popped in declaration order.
+            stack.extend(
+                [
+                    (
+                        attr,
+                        _PathSegment(segment, attr.rm_attribute_name),
+                        node_id,
+                        repeated_attrs is not None and repeated_attrs[i],
+                    )
+                    for i, attr in reversed(list(enumerate(attributes)))
+                ]
+            )
+
+        elif isinstance(obj, CPrimitiveObject):
+            c = obj.constraint
+            if isinstance(c, _INTERVAL_CONSTRAINT_TYPES):
+                iv = c.interval
+                if iv is not None and iv.lower is not None and iv.upper is not None:
+                    intervals.append((iv, segment, "constraint", node_id))
+
+    return _DefinitionFacts(
+        node_ids=tuple(node_ids),
+        intervals=tuple(intervals),
+        duplicate_attributes=tuple(duplicate_attributes),
+        duplicate_children=tuple(duplicate_children),
+    )
+
+
+def _definition_facts(
+    ctx: ValidationContext, artefact: Archetype | Template
+) -> _DefinitionFacts:
+    """Return the definition facts for `artefact`, walking it at most once per `ctx`."""
+
+    cached = ctx.cache.get("semantic.definition_facts")
+    if cached is None:
+        if artefact.definition is None:
+            cached = _DefinitionFacts()
+        else:
+            cached = _walk_definition(artefact.definition)
+        ctx.cache["semantic.definition_facts"] = cached
+    return cast(_DefinitionFacts, cached)
+
+
+def _interval_violation(interval: Interval) -> str | None:
+    """Return a message if `interval` breaks a basic invariant, else None."""
+
+    lo = interval.lower
+    hi = interval.upper
+    if lo is None or hi is None:
+        return None
+
+    # Invariant: if both bounds exist, lower <= upper.
+    if lo > hi:
+        return f"Invalid interval: lower bound {lo} exceeds upper bound {hi}"
+
+    # Invariant: if bounds are equal, interval must not be empty.
+    if lo == hi and (not interval.lower_included or not interval.upper_included):
+        return "Invalid interval: empty interval when bounds are equal and one side is excluded"
+
+    return None
+
+
+def _collect_referenced_node_ids(
+    ctx: ValidationContext,
     *,
     artefact: Archetype | Template,
-) -> Iterator[tuple[str, SourceSpan | None]]:
-    if artefact.concept is not None and _is_node_id_like(artefact.concept):
-        yield artefact.concept, artefact.span
+) -> list[tuple[str, SourceSpan | None]]:
+    out: list[tuple[str, SourceSpan | None]] = []
+    concept = artefact.concept
+    if concept is not None and _is_node_id_like(concept):
+        out.append((concept, artefact.span))
 
-    if artefact.definition is None:
-        return
+    # Hot loop: query the memoised parser directly, skipping the wrapper frame.
+    parse = _try_parse_specialised_node_id
+    append = out.append
+    for item in _definition_facts(ctx, artefact).node_ids:
+        if parse(item[0]) is not None:
+            append(item)
+    return out
 
-    for obj in _iter_cobject_tree(artefact.definition):
-        if obj.node_id is None:
-            continue
-        if _is_node_id_like(obj.node_id):
-            yield obj.node_id, obj.span
+
+# `atNNNN` / `acNNNN` followed by `.n` suffixes; each suffix is a positive
+# integer (specialisation suffix segments start at 1).
+_SPECIALISED_NODE_ID_RE = re.compile(r"(a[tc]\d{4})(?:\.0*[1-9]\d*)*", re.ASCII)
 
 
+@lru_cache(maxsize=4096)
 def _try_parse_specialised_node_id(value: str) -> tuple[str, int] | None:
     """Parse `atNNNN(.n)*` / `acNNNN(.n)*`.
 
@@ -80,33 +332,21 @@ def _try_parse_specialised_node_id(value: str) -> tuple[str, int] | None:
     Notes:
         - Suffix segments must be positive integers (>= 1).
         - This is a permissive parser used for validation rules; it must not raise.
+        - Results are memoised: the same node ids are classified by several
+          checks per artefact.
     """
 
-    if not value:
-        return None
-
-    parts = value.split(".")
-    if not parts:
+    m = _SPECIALISED_NODE_ID_RE.fullmatch(value)
+    if m is None:
         return None
-
-    base = parts[0]
-    if try_parse_node_id(base) is None:
-        return None
-
-    if len(parts) == 1:
-        return base, 0
-
-    for seg in parts[1:]:
-        if not seg or not seg.isdigit():
-            return None
-        # Basic safety: specialisation suffix segments start at 1.
-        if int(seg) < 1:
-            return None
-
-    return base, len(parts) - 1
+    return m.group(1), value.count(".")
 
 
 def _is_node_id_like(value: str) -> bool:
+    # Cheap prefix reject before the memoised parse. Rule-text tokens are
+    # mostly ordinary words; this keeps them out of the LRU cache.
+    if len(value) < 6 or value[0] != "a" or value[1] not in "tc":
+        return False
     return _try_parse_specialised_node_id(value) is not None
 
 
@@ -119,20 +359,52 @@ def _specialisation_depth(value: str) -> int | None:
 
 
 def _path_resolves_in_definition(
-    definition: CComplexObject | None, *, path: str
+    ctx: ValidationContext, definition: CComplexObject | None, *, path: str
 ) -> bool:
-    """Return True if `path` can be followed in the given definition tree."""
+    """Return True if `path` can be followed in the given definition tree.
 
-    nodes, issues = resolve_path(definition, path)
-    if issues:
-        return False
-    return nodes is not None and nodes != ()
+    Results are memoised per `ctx`: AOM280 and AOM290 often repeat paths, and
+    distinct paths share prefixes resolved through one `PathResolutionCache`.
+    """
 
+    resolved = cast(dict[str, bool], ctx.cache.setdefault("semantic.path_resolves", {}))
+    ok = resolved.get(path)
+    if ok is None:
+        trie = ctx.cache.get("semantic.path_trie")
+        if trie is None:
+            trie = PathResolutionCache(definition)
+            ctx.cache["semantic.path_trie"] = trie
+        nodes, issues = resolve_path_cached(
+            definition, path, cache=cast(PathResolutionCache, trie)
+        )
+        ok = not issues and nodes is not None and nodes != ()
+        resolved[path] = ok
+    return ok
 
-def _defined_codes(term: ArchetypeTerminology | None) -> set[str]:
-    if term is None:
-        return set()
-    return {td.code for td in term.term_definitions}
+
+def _defined_codes(
+    ctx: ValidationContext, term: ArchetypeTerminology | None
+) -> frozenset[str]:
+    """Return the codes defined by `term`, built once per `ctx`."""
+
+    cached = ctx.cache.get("semantic.defined_codes")
+    if cached is None:
+        if term is None:
+            cached = frozenset[str]()
+        else:
+            # A list comprehension avoids generator resumption per item,
+            # which matters for terminologies with thousands of codes.
+            cached = frozenset([td.code for td in term.term_definitions])
+        ctx.cache["semantic.defined_codes"] = cached
+    return cast(frozenset[str], cached)
+
+
+# Runs of alphanumeric characters and dots (same classes as `str.isalnum()`).
+_ALNUM_DOT_RE = re.compile(r"(?:[^\W_]|\.)+")
+
+# Whitespace-delimited tokens starting with '/', minus common wrappers.
+# Brackets are kept for `/attr[node_id]` segments.
+_PATH_TOKEN_RE = re.compile(r"""(?<!\S)["'(),;]*(/\S*?)["'(),;]*(?!\S)""")
 
 
 def _iter_alnum_dot_tokens(text: str) -> Iterator[str]:
@@ -141,22 +413,7 @@ def _iter_alnum_dot_tokens(text: str) -> Iterator[str]:
     Used for best-effort extraction of specialised node ids like `at0001.1`.
     """
 
-    buf: list[str] = []
-
-    def flush() -> Iterator[str]:
-        nonlocal buf
-        if buf:
-            tok = "".join(buf)
-            buf = []
-            yield tok
-
-    for ch in text:
-        if ch.isalnum() or ch == ".":
-            buf.append(ch)
-            continue
-        yield from flush()
-
-    yield from flush()
+    return iter(_ALNUM_DOT_RE.findall(text))
 
 
 def _iter_path_like_tokens(text: str) -> Iterator[str]:
@@ -168,10 +425,8 @@ def _iter_path_like_tokens(text: str) -> Iterator[str]:
         - '/path...'   (quotes stripped)
     """
 
-    for raw in text.split():
-        # Keep brackets for `/attr[node_id]` segments; only strip common wrappers.
-        tok = raw.strip("\"'(),;")
-        if tok.startswith("/") and len(tok) > 1:
+    for tok in _PATH_TOKEN_RE.findall(text):
+        if len(tok) > 1:
             yield tok
 
 
@@ -183,14 +438,12 @@ def _iter_rule_references(statement_text: str) -> Iterator[tuple[str, str]]:
         - "code": terminology node-ids (at/ac with optional .n suffixes)
     """
 
-    paths = tuple(_iter_path_like_tokens(statement_text))
-    for p in paths:
+    for p in _iter_path_like_tokens(statement_text):
         yield "path", p
 
-    # Avoid double-reporting node ids already embedded in paths.
-    masked = statement_text
-    for p in paths:
-        masked = masked.replace(p, " ")
+    # Avoid double-reporting node ids already embedded in paths: blank out
+    # every path token in one pass.
+    masked = _PATH_TOKEN_RE.sub(" ", statement_text)
 
     for tok in _iter_alnum_dot_tokens(masked):
         if _is_node_id_like(tok):
@@ -204,39 +457,32 @@ def check_referenced_terminology_codes_exist(ctx: ValidationContext) -> Iterable
     if not isinstance(artefact, (Archetype, Template)):
         return ()
 
-    defined = _defined_codes(artefact.terminology)
+    defined = _defined_codes(ctx, artefact.terminology)
 
-    referenced: list[tuple[str, SourceSpan | None]] = list(
-        _iter_referenced_node_ids(artefact=artefact)
-    )
+    # No local sort: IssueCollector orders issues by location, code and
+    # message, and the inputs are produced in deterministic walk order.
+    undefined: list[tuple[str, SourceSpan | None]] = [
+        (code, span)
+        for code, span in _collect_referenced_node_ids(ctx, artefact=artefact)
+        if code not in defined
+    ]
 
     # Term bindings reference internal codes too.
     if artefact.terminology is not None:
         for b in artefact.terminology.term_bindings:
-            if _is_node_id_like(b.code):
-                referenced.append((b.code, b.span))
-
-    referenced.sort(key=lambda item: (_span_key(item[1]), item[0]))
-
-    issues: list[Issue] = []
-    for code, span in referenced:
-        if code in defined:
-            continue
-        issues.append(
-            Issue(
-                code="AOM200",
-                severity=Severity.ERROR,
-                message=f"Terminology code '{code}' referenced but not defined",
-                file=span.file if span else None,
-                line=span.start_line if span else None,
-                col=span.start_col if span else None,
-                end_line=span.end_line if span else None,
-                end_col=span.end_col if span else None,
-                node_id=code,
-            )
+            if b.code not in defined and _is_node_id_like(b.code):
+                undefined.append((b.code, b.span))
+
+    return [
+        _issue(
+            "AOM200",
+            Severity.ERROR,
+            f"Terminology code '{code}' referenced but not defined",
+            span,
+            node_id=code,
         )
-
-    return tuple(issues)
+        for code, span in undefined
+    ]
 
 
 def check_template_overlay_exclusion_paths(ctx: ValidationContext) -> Iterable[Issue]:
@@ -249,50 +495,39 @@ def check_template_overlay_exclusion_paths(ctx: ValidationContext) -> Iterable[I
     if not isinstance(artefact, Template):
         return ()
 
-    issues: list[Issue] = []
+    if not artefact.excluded_paths and not artefact.overlay_paths:
+        return ()
 
-    span = artefact.span
-    file = span.file if span else None
-    line = span.start_line if span else None
-    col = span.start_col if span else None
-    end_line = span.end_line if span else None
-    end_col = span.end_col if span else None
+    issues: list[Issue] = []
 
+    fields = _span_fields(artefact.span)
     for p in artefact.excluded_paths:
-        if _path_resolves_in_definition(artefact.definition, path=p):
+        if _path_resolves_in_definition(ctx, artefact.definition, path=p):
             continue
         issues.append(
-            Issue(
-                code="AOM280",
-                severity=Severity.ERROR,
-                message=f"Template exclusion path '{p}' does not resolve",
-                file=file,
-                line=line,
-                col=col,
-                end_line=end_line,
-                end_col=end_col,
+            _issue_at(
+                "AOM280",
+                Severity.ERROR,
+                f"Template exclusion path '{p}' does not resolve",
+                fields,
                 path=p,
             )
         )
 
     for p in artefact.overlay_paths:
-        if _path_resolves_in_definition(artefact.definition, path=p):
+        if _path_resolves_in_definition(ctx, artefact.definition, path=p):
             continue
         issues.append(
-            Issue(
-                code="AOM280",
-                severity=Severity.ERROR,
-                message=f"Template overlay path '{p}' does not resolve",
-                file=file,
-                line=line,
-                col=col,
-                end_line=end_line,
-                end_col=end_col,
+            _issue_at(
+                "AOM280",
+                Severity.ERROR,
+                f"Template overlay path '{p}' does not resolve",
+                fields,
                 path=p,
             )
         )
 
-    return tuple(issues)
+    return issues
 
 
 def check_rules_reference_known_paths_and_codes(
@@ -311,34 +546,24 @@ def check_rules_reference_known_paths_and_codes(
     if not isinstance(artefact, (Archetype, Template)):
         return ()
 
-    if getattr(artefact, "rules", ()) == ():
+    if not artefact.rules:
         return ()
 
-    defined = _defined_codes(artefact.terminology)
+    defined = _defined_codes(ctx, artefact.terminology)
 
     issues: list[Issue] = []
     for stmt in artefact.rules:
-        span = getattr(stmt, "span", None)
-        file = span.file if span else None
-        line = span.start_line if span else None
-        col = span.start_col if span else None
-        end_line = span.end_line if span else None
-        end_col = span.end_col if span else None
-
-        for kind, value in _iter_rule_references(getattr(stmt, "text", "")):
+        fields = _span_fields(stmt.span)
+        for kind, value in _iter_rule_references(stmt.text):
             if kind == "path":
-                if _path_resolves_in_definition(artefact.definition, path=value):
+                if _path_resolves_in_definition(ctx, artefact.definition, path=value):
                     continue
                 issues.append(
-                    Issue(
-                        code="AOM290",
-                        severity=Severity.WARN,
-                        message=f"Rule references invalid path '{value}'",
-                        file=file,
-                        line=line,
-                        col=col,
-                        end_line=end_line,
-                        end_col=end_col,
+                    _issue_at(
+                        "AOM290",
+                        Severity.WARN,
+                        f"Rule references invalid path '{value}'",
+                        fields,
                         path=value,
                     )
                 )
@@ -348,20 +573,16 @@ def check_rules_reference_known_paths_and_codes(
                 if value in defined:
                     continue
                 issues.append(
-                    Issue(
-                        code="AOM290",
-                        severity=Severity.WARN,
-                        message=f"Rule references unknown terminology code '{value}'",
-                        file=file,
-                        line=line,
-                        col=col,
-                        end_line=end_line,
-                        end_col=end_col,
+                    _issue_at(
+                        "AOM290",
+                        Severity.WARN,
+                        f"Rule references unknown terminology code '{value}'",
+                        fields,
                         node_id=value,
                     )
                 )
 
-    return tuple(issues)
+    return issues
 
 
 def check_node_id_format(ctx: ValidationContext) -> Iterable[Issue]:
@@ -377,41 +598,46 @@ def check_node_id_format(ctx: ValidationContext) -> Iterable[Issue]:
     if not isinstance(artefact, (Archetype, Template)):
         return ()
 
-    issues: list[Issue] = []
+    parse = _try_parse_specialised_node_id
+
+    # Filter while collecting: most ids are valid, so (code, span) pairs are
+    # only built for the few invalid ones.
+    invalid: list[tuple[str, SourceSpan | None]] = []
+    concept = artefact.concept
+    if concept is not None and parse(concept) is None:
+        invalid.append((concept, artefact.span))
+
+    invalid.extend(
+        [
+            item
+            for item in _definition_facts(ctx, artefact).node_ids
+            if parse(item[0]) is None
+        ]
+    )
 
-    def maybe_emit(value: str, span: SourceSpan | None) -> None:
-        if _is_node_id_like(value):
-            return
-        issues.append(
-            Issue(
-                code="AOM210",
-                severity=Severity.ERROR,
-                message=f"Invalid node id format: '{value}'",
-                file=span.file if span else None,
-                line=span.start_line if span else None,
-                col=span.start_col if span else None,
-                end_line=span.end_line if span else None,
-                end_col=span.end_col if span else None,
-                node_id=value,
-            )
+    term = artefact.terminology
+    if term is not None:
+        invalid.extend(
+            [
+                (td.code, td.span)
+                for td in term.term_definitions
+                if parse(td.code) is None
+            ]
+        )
+        invalid.extend(
+            [(b.code, b.span) for b in term.term_bindings if parse(b.code) is None]
         )
 
-    if artefact.concept is not None:
-        maybe_emit(artefact.concept, artefact.span)
-
-    if artefact.definition is not None:
-        for obj in _iter_cobject_tree(artefact.definition):
-            if obj.node_id is None:
-                continue
-            maybe_emit(obj.node_id, obj.span)
-
-    if artefact.terminology is not None:
-        for td in artefact.terminology.term_definitions:
-            maybe_emit(td.code, td.span)
-        for b in artefact.terminology.term_bindings:
-            maybe_emit(b.code, b.span)
-
-    return tuple(issues)
+    return [
+        _issue(
+            "AOM210",
+            Severity.ERROR,
+            f"Invalid node id format: '{value}'",
+            span,
+            node_id=value,
+        )
+        for value, span in invalid
+    ]
 
 
 def check_specialisation_depth_mismatch(ctx: ValidationContext) -> Iterable[Issue]:
@@ -435,38 +661,29 @@ def check_specialisation_depth_mismatch(ctx: ValidationContext) -> Iterable[Issu
         # Let AOM210 report the invalid concept node id.
         return ()
 
+    parse = _try_parse_specialised_node_id
     issues: list[Issue] = []
-
-    def check_depth(value: str, span: SourceSpan | None) -> None:
-        depth = _specialisation_depth(value)
-        if depth is None:
-            return
+    for value, span in _definition_facts(ctx, artefact).node_ids:
+        parsed = parse(value)
+        if parsed is None:
+            continue
+        depth = parsed[1]
         if depth <= artefact_depth:
-            return
+            continue
         issues.append(
-            Issue(
-                code="AOM230",
-                severity=Severity.ERROR,
-                message=(
+            _issue(
+                "AOM230",
+                Severity.ERROR,
+                (
                     "Specialisation level mismatch: "
                     f"'{value}' depth {depth} exceeds archetype depth {artefact_depth}"
                 ),
-                file=span.file if span else None,
-                line=span.start_line if span else None,
-                col=span.start_col if span else None,
-                end_line=span.end_line if span else None,
-                end_col=span.end_col if span else None,
+                span,
                 node_id=value,
             )
         )
 
-    if artefact.definition is not None:
-        for obj in _iter_cobject_tree(artefact.definition):
-            if obj.node_id is None:
-                continue
-            check_depth(obj.node_id, obj.span)
-
-    return tuple(issues)
+    return issues
 
 
 def check_duplicates_in_scopes(ctx: ValidationContext) -> Iterable[Issue]:
@@ -486,63 +703,31 @@ def check_duplicates_in_scopes(ctx: ValidationContext) -> Iterable[Issue]:
     if artefact.definition is None:
         return ()
 
-    issues: list[Issue] = []
-
-    def walk(obj: CObject, *, path: str) -> None:
-        if not isinstance(obj, CComplexObject):
-            return
-
-        seen_attr_names: set[str] = set()
-        for attr in obj.attributes:
-            attr_name = attr.rm_attribute_name
-            attr_path = f"{path}/{attr_name}"
+    facts = _definition_facts(ctx, artefact)
 
-            if attr_name in seen_attr_names:
-                span = attr.span
-                issues.append(
-                    Issue(
-                        code="AOM240",
-                        severity=Severity.ERROR,
-                        message=f"Duplicate attribute name '{attr_name}' in scope",
-                        file=span.file if span else None,
-                        line=span.start_line if span else None,
-                        col=span.start_col if span else None,
-                        end_line=span.end_line if span else None,
-                        end_col=span.end_col if span else None,
-                        path=attr_path,
-                        node_id=obj.node_id,
-                    )
-                )
-            else:
-                seen_attr_names.add(attr_name)
-
-            seen_child_node_ids: set[str] = set()
-            for child in attr.children:
-                if child.node_id is not None and child.node_id in seen_child_node_ids:
-                    span = child.span
-                    issues.append(
-                        Issue(
-                            code="AOM240",
-                            severity=Severity.ERROR,
-                            message=(
-                                f"Duplicate node id '{child.node_id}' within attribute '{attr_name}'"
-                            ),
-                            file=span.file if span else None,
-                            line=span.start_line if span else None,
-                            col=span.start_col if span else None,
-                            end_line=span.end_line if span else None,
-                            end_col=span.end_col if span else None,
-                            path=attr_path,
-                            node_id=child.node_id,
-                        )
-                    )
-                elif child.node_id is not None:
-                    seen_child_node_ids.add(child.node_id)
-
-                walk(child, path=attr_path)
-
-    walk(artefact.definition, path="/definition")
-    return tuple(issues)
+    issues = [
+        _issue(
+            "AOM240",
+            Severity.ERROR,
+            f"Duplicate attribute name '{attr.rm_attribute_name}' in scope",
+            attr.span,
+            path=_render_path(attr_segment),
+            node_id=owner_node_id,
+        )
+        for attr, attr_segment, owner_node_id in facts.duplicate_attributes
+    ]
+    issues.extend(
+        _issue(
+            "AOM240",
+            Severity.ERROR,
+            f"Duplicate node id '{child.node_id}' within attribute '{attr_segment.name}'",
+            child.span,
+            path=_render_path(attr_segment),
+            node_id=child.node_id,
+        )
+        for child, attr_segment in facts.duplicate_children
+    )
+    return issues
 
 
 def check_interval_invariants(ctx: ValidationContext) -> Iterable[Issue]:
@@ -560,103 +745,21 @@ def check_interval_invariants(ctx: ValidationContext) -> Iterable[Issue]:
     if not isinstance(artefact, (Archetype, Template)):
         return ()
 
-    if artefact.definition is None:
-        return ()
-
-    issues: list[Issue] = []
-
-    def emit(
-        *,
-        message: str,
-        span: SourceSpan | None,
-        path: str,
-        node_id: str | None,
-    ) -> None:
-        issues.append(
-            Issue(
-                code="AOM250",
-                severity=Severity.ERROR,
-                message=message,
-                file=span.file if span else None,
-                line=span.start_line if span else None,
-                col=span.start_col if span else None,
-                end_line=span.end_line if span else None,
-                end_col=span.end_col if span else None,
-                path=path,
-                node_id=node_id,
-            )
+    # Only fully bounded intervals are recorded (typically 0..1 and 1..1
+    # occurrences); their paths are rendered only for actual violations.
+    intervals = _definition_facts(ctx, artefact).intervals
+    return [
+        _issue(
+            "AOM250",
+            Severity.ERROR,
+            message,
+            interval.span,
+            path=f"{_render_path(segment)}/{suffix}",
+            node_id=node_id,
         )
-
-    def check_interval(
-        *,
-        interval: Interval,
-        path: str,
-        node_id: str | None,
-    ) -> None:
-        lo = interval.lower
-        hi = interval.upper
-
-        # Invariant: if both bounds exist, lower <= upper.
-        if lo is not None and hi is not None and lo > hi:
-            emit(
-                message=f"Invalid interval: lower bound {lo} exceeds upper bound {hi}",
-                span=interval.span,
-                path=path,
-                node_id=node_id,
-            )
-            return
-
-        # Invariant: if bounds are equal, interval must not be empty.
-        if lo is not None and hi is not None and lo == hi:
-            if not interval.lower_included or not interval.upper_included:
-                emit(
-                    message=(
-                        "Invalid interval: empty interval when bounds are equal and one side is excluded"
-                    ),
-                    span=interval.span,
-                    path=path,
-                    node_id=node_id,
-                )
-
-    def walk(obj: CObject, *, path: str) -> None:
-        if obj.occurrences is not None:
-            check_interval(
-                interval=obj.occurrences,
-                path=f"{path}/occurrences",
-                node_id=obj.node_id,
-            )
-
-        if isinstance(obj, CComplexObject):
-            for attr in obj.attributes:
-                attr_path = f"{path}/{attr.rm_attribute_name}"
-
-                if attr.cardinality is not None:
-                    check_interval(
-                        interval=attr.cardinality.occurrences,
-                        path=f"{attr_path}/cardinality",
-                        node_id=obj.node_id,
-                    )
-
-                for child in attr.children:
-                    walk(child, path=attr_path)
-
-        if isinstance(obj, CPrimitiveObject):
-            c = obj.constraint
-            if isinstance(c, PrimitiveIntegerConstraint) and c.interval is not None:
-                check_interval(
-                    interval=c.interval,
-                    path=f"{path}/constraint",
-                    node_id=obj.node_id,
-                )
-            if isinstance(c, PrimitiveRealConstraint) and c.interval is not None:
-                check_interval(
-                    interval=c.interval,
-                    path=f"{path}/constraint",
-                    node_id=obj.node_id,
-                )
-
-    walk(artefact.definition, path="/definition")
-    return tuple(issues)
+        for interval, segment, suffix, node_id in intervals
+        if (message := _interval_violation(interval)) is not None
+    ]
 
 
 def check_value_set_integrity(ctx: ValidationContext) -> Iterable[Issue]:
@@ -674,53 +777,48 @@ def check_value_set_integrity(ctx: ValidationContext) -> Iterable[Issue]:
         return ()
 
     term = artefact.terminology
-    if term is None:
+    if term is None or not term.value_sets:
         return ()
 
-    defined = _defined_codes(term)
+    defined = _defined_codes(ctx, term)
     issues: list[Issue] = []
 
-    def emit(*, message: str, span: SourceSpan | None, path: str, node_id: str | None):
-        issues.append(
-            Issue(
-                code="AOM260",
-                severity=Severity.ERROR,
-                message=message,
-                file=span.file if span else None,
-                line=span.start_line if span else None,
-                col=span.start_col if span else None,
-                end_line=span.end_line if span else None,
-                end_col=span.end_col if span else None,
-                path=path,
-                node_id=node_id,
-            )
-        )
-
     for vs in term.value_sets:
-        vs_path = f"/terminology/value_sets/{vs.id}"
+        members = vs.members
+        if members and defined.issuperset(members):
+            # Common case: one C-level subset test instead of a Python loop.
+            continue
 
-        if len(vs.members) == 0:
-            emit(
-                message=f"Value set '{vs.id}' must not be empty",
-                span=vs.span,
-                path=vs_path,
-                node_id=vs.id,
+        vs_path = f"/terminology/value_sets/{vs.id}"
+        if not members:
+            issues.append(
+                _issue(
+                    "AOM260",
+                    Severity.ERROR,
+                    f"Value set '{vs.id}' must not be empty",
+                    vs.span,
+                    path=vs_path,
+                    node_id=vs.id,
+                )
             )
             continue
 
-        for member in vs.members:
-            if member in defined:
-                continue
-            emit(
-                message=(
-                    f"Value set '{vs.id}' references undefined terminology code '{member}'"
-                ),
-                span=vs.span,
+        # Report undefined members in declaration order.
+        fields = _span_fields(vs.span)
+        issues.extend(
+            _issue_at(
+                "AOM260",
+                Severity.ERROR,
+                f"Value set '{vs.id}' references undefined terminology code '{member}'",
+                fields,
                 path=vs_path,
                 node_id=member,
             )
+            for member in members
+            if member not in defined
+        )
 
-    return tuple(issues)
+    return issues
 
 
 def check_language_presence_and_basic_structure(
@@ -753,23 +851,23 @@ def check_language_presence_and_basic_structure(
         path: str,
     ) -> None:
         issues.append(
-            Issue(
-                code="AOM270",
-                severity=Severity.WARN,
-                message=message,
-                file=span.file if span else None,
-                line=span.start_line if span else None,
-                col=span.start_col if span else None,
-                end_line=span.end_line if span else None,
-                end_col=span.end_col if span else None,
+            _issue(
+                "AOM270",
+                Severity.WARN,
+                message,
+                span,
                 path=path,
             )
         )
 
     original_language = artefact.original_language
     languages = artefact.languages
+    languages_set = frozenset(languages)
+    has_original_language = (
+        original_language is not None and original_language.strip() != ""
+    )
 
-    if original_language is None or original_language.strip() == "":
+    if not has_original_language:
         emit(
             message="Missing original_language",
             span=artefact.span,
@@ -782,8 +880,8 @@ def check_language_presence_and_basic_structure(
             span=artefact.span,
             path="/languages",
         )
-    elif original_language is not None and original_language.strip() != "":
-        if original_language not in languages:
+    elif has_original_language:
+        if original_language not in languages_set:
             emit(
                 message=(
                     f"original_language '{original_language}' is not present in languages {languages}"
@@ -794,9 +892,11 @@ def check_language_presence_and_basic_structure(
 
     term = artefact.terminology
     if term is None:
-        return tuple(issues)
+        return issues
+
+    has_term_original_language = term.original_language.strip() != ""
 
-    if term.original_language.strip() == "":
+    if not has_term_original_language:
         emit(
             message="Terminology missing original_language",
             span=term.span,
@@ -804,9 +904,8 @@ def check_language_presence_and_basic_structure(
         )
 
     if (
-        original_language is not None
-        and original_language.strip() != ""
-        and term.original_language.strip() != ""
+        has_original_language
+        and has_term_original_language
         and term.original_language != original_language
     ):
         emit(
@@ -826,7 +925,7 @@ def check_language_presence_and_basic_structure(
                     span=td.span,
                     path=f"/terminology/term_definitions/{td.code}/language",
                 )
-            elif td.language not in languages:
+            elif td.language not in languages_set:
                 emit(
                     message=(
                         f"Term definition '{td.code}' language '{td.language}' is not declared in languages {languages}"
@@ -835,50 +934,61 @@ def check_language_presence_and_basic_structure(
                     path=f"/terminology/term_definitions/{td.code}/language",
                 )
 
-    return tuple(issues)
+    return issues
 
 
+# Registered into the built-in registry rather than DEFAULT_REGISTRY, which may
+# be monkeypatched when this module is first imported.
 register_semantic_check(
     check_referenced_terminology_codes_exist,
     name="aom200_referenced_codes_exist_in_terminology",
+    registry=_BUILTIN_REGISTRY,
 )
 
 register_semantic_check(
     check_node_id_format,
     name="aom210_node_id_format",
+    registry=_BUILTIN_REGISTRY,
 )
 
 register_semantic_check(
     check_specialisation_depth_mismatch,
     name="aom230_specialisation_depth_mismatch",
+    registry=_BUILTIN_REGISTRY,
 )
 
 register_semantic_check(
     check_duplicates_in_scopes,
     name="aom240_duplicates_in_scopes_basic",
+    registry=_BUILTIN_REGISTRY,
 )
 
 register_semantic_check(
     check_interval_invariants,
     name="aom250_interval_invariants",
+    registry=_BUILTIN_REGISTRY,
 )
 
 register_semantic_check(
     check_value_set_integrity,
     name="aom260_value_set_integrity",
+    registry=_BUILTIN_REGISTRY,
 )
 
 register_semantic_check(
     check_language_presence_and_basic_structure,
     name="aom270_language_presence_and_basic_structure",
+    registry=_BUILTIN_REGISTRY,
 )
 
 register_semantic_check(
     check_template_overlay_exclusion_paths,
     name="aom280_template_overlay_exclusion_paths",
+    registry=_BUILTIN_REGISTRY,
 )
 
 register_semantic_check(
     check_rules_reference_known_paths_and_codes,
     name="aom290_rules_reference_known_paths_and_codes",
+    registry=_BUILTIN_REGISTRY,
 )
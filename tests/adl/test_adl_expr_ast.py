@@ -1,5 +1,8 @@
 import dataclasses
 
+import pytest
+
+from openehr_am.adl import cadl_ast, expr_ast
 from openehr_am.adl.expr_ast import (
     BinaryOp,
     ExprBinary,
@@ -13,6 +16,7 @@ from openehr_am.adl.expr_ast import (
     UnaryOp,
 )
 from openehr_am.antlr.span import SourceSpan
+from openehr_am.aom import constraints
 
 
 def test_expr_ops_are_string_enums() -> None:
@@ -75,3 +79,32 @@ def test_expr_string_and_boolean_smoke() -> None:
     b = ExprBoolean(value=True)
     assert s.value == "hello"
     assert b.value is True
+
+
+_SLOTTED_NODE_MODULES = (expr_ast, cadl_ast, constraints)
+
+_SLOTTED_NODE_TYPES = [
+    obj
+    for module in _SLOTTED_NODE_MODULES
+    for obj in vars(module).values()
+    if isinstance(obj, type)
+    and dataclasses.is_dataclass(obj)
+    and obj.__module__ == module.__name__
+]
+
+
+def test_slots_guard_covers_every_node_module() -> None:
+    # An empty parametrisation would silently skip the guard below.
+    assert {cls.__module__ for cls in _SLOTTED_NODE_TYPES} == {
+        module.__name__ for module in _SLOTTED_NODE_MODULES
+    }
+
+
+@pytest.mark.parametrize(
+    "cls", _SLOTTED_NODE_TYPES, ids=lambda cls: f"{cls.__module__}.{cls.__qualname__}"
+)
+def test_ast_nodes_use_slots(cls: type) -> None:
+    # object.__new__ skips __init__, so no field values are needed; a class
+    # that lost slots=True (here or on a base) gets an instance __dict__.
+    instance = object.__new__(cls)
+    assert not hasattr(instance, "__dict__")
@@ -27,3 +27,16 @@ def test_antlr_error_listener_converts_syntax_error_to_issue() -> None:
     assert issue.line == 3
     assert issue.col == 1  # ANTLR column is 0-based
     assert issue.message == "Unexpected token '}'"
+
+
+def test_antlr_error_listener_ignores_prediction_reports() -> None:
+    collector = IssueCollector()
+    listener = IssueCollectingErrorListener(collector)
+
+    # ANTLR's proxy dispatches these to every listener during full-context
+    # prediction; they must not fail or produce Issues.
+    listener.reportAttemptingFullContext(None, None, 0, 1, None, None)
+    listener.reportContextSensitivity(None, None, 0, 1, 0, None)
+    listener.reportAmbiguity(None, None, 0, 1, False, None, None)
+
+    assert len(collector) == 0
@@ -56,3 +56,52 @@ def test_archetype_repository_duplicate_id_emits_issue_and_keeps_first(
     assert archetype is not None
     assert archetype.span is not None
     assert archetype.span.file == str(tmp_path / "a.adl")
+
+
+def test_archetype_repository_identical_files_report_issues_per_file(
+    tmp_path: Path,
+) -> None:
+    from openehr_am.aom.repository import ArchetypeRepository
+
+    bad = _read_fixture("invalid_missing_id.adl")
+    (tmp_path / "a.adl").write_text(bad, encoding="utf-8")
+    (tmp_path / "b.adl").write_text(bad, encoding="utf-8")
+
+    repo, issues = ArchetypeRepository.load_from_dir(tmp_path)
+    assert len(repo) == 0
+
+    by_file = {
+        name: [
+            (i.code, i.line, i.col, i.message)
+            for i in issues
+            if i.file == str(tmp_path / name)
+        ]
+        for name in ("a.adl", "b.adl")
+    }
+    assert by_file["a.adl"]
+    assert by_file["a.adl"] == by_file["b.adl"]
+    assert len(issues) == 2 * len(by_file["a.adl"])
+
+
+def test_archetype_repository_max_workers_matches_sequential_load(
+    tmp_path: Path,
+) -> None:
+    from openehr_am.aom.repository import ArchetypeRepository
+
+    for name, fixture in (
+        ("a.adl", "minimal_archetype.adl"),
+        ("b.adl", "invalid_missing_id.adl"),
+        ("c.adl", "minimal_archetype.adl"),
+        ("d.adl", "minimal_cadl_definition.adl"),
+        ("e.adl", "invalid_missing_id.adl"),
+    ):
+        (tmp_path / name).write_text(_read_fixture(fixture), encoding="utf-8")
+
+    repo, issues = ArchetypeRepository.load_from_dir(tmp_path)
+    parallel_repo, parallel_issues = ArchetypeRepository.load_from_dir(
+        tmp_path, max_workers=2
+    )
+
+    assert parallel_issues == issues
+    assert parallel_repo.ids() == repo.ids()
+    assert parallel_repo.archetypes == repo.archetypes
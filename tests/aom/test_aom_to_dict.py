@@ -88,3 +88,21 @@ def test_aom_to_dict_is_deterministic_and_json_serializable() -> None:
 
     # Must be JSON serializable.
     json.dumps(d1)
+
+
+def test_aom_to_dict_handles_definitions_deeper_than_recursion_limit() -> None:
+    import sys
+
+    depth = sys.getrecursionlimit() + 100
+    node = CComplexObject(rm_type_name="ELEMENT", node_id="at0001")
+    for _ in range(depth):
+        node = CComplexObject(
+            rm_type_name="CLUSTER",
+            attributes=(CAttribute(rm_attribute_name="items", children=(node,)),),
+        )
+
+    d = aom_to_dict(node)
+    for _ in range(depth):
+        assert d["rm_type_name"] == "CLUSTER"
+        d = d["attributes"][0]["children"][0]
+    assert d["node_id"] == "at0001"
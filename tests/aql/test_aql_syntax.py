@@ -23,6 +23,7 @@ def test_check_aql_syntax_accepts_valid_queries(query: str) -> None:
         "SELECT FROM",
         "SELECT e/ehr_id/value EHR e",  # missing FROM
         "SELECT e/ehr_id/value FROM",  # incomplete
+        "SELECT e/ehr_id/value FROM EHR e OR",  # full-context prediction
     ],
 )
 def test_check_aql_syntax_reports_aql100(query: str) -> None:
@@ -30,3 +31,21 @@ def test_check_aql_syntax_reports_aql100(query: str) -> None:
     assert issues
     assert issues[0].code == "AQL100"
     assert issues[0].severity.value == "ERROR"
+
+
+@pytest.mark.parametrize(
+    ("query", "line", "col"),
+    [
+        ("", 1, 1),
+        (" \n\t", 2, 2),
+        ("\r\n\r\n", 3, 1),
+        ("  \n\t ", 2, 3),
+    ],
+)
+def test_check_aql_syntax_blank_query_reports_eof_location(
+    query: str, line: int, col: int
+) -> None:
+    issues = check_aql_syntax(query, filename="q.aql")
+    assert [(i.code, i.file, i.line, i.col, i.message) for i in issues] == [
+        ("AQL100", "q.aql", line, col, "mismatched input '<EOF>' expecting SELECT")
+    ]
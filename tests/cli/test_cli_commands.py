@@ -62,8 +62,11 @@ def _archetype_adl(archetype_id: str) -> str:
     )
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def cli_runner() -> CliRunner:
+    # CliRunner only holds invocation settings; each invoke() isolates I/O.
+    # Tests pass catch_exceptions=False so a crash surfaces as its own
+    # traceback instead of an unexpected exit code.
     return CliRunner()
 
 
@@ -73,7 +76,7 @@ def test_lint_text_exit_1_and_renders_issues(
     p = tmp_path / "bad.adl"
     p.write_text(_minimal_adl_with_missing_sections(), encoding="utf-8")
 
-    res = cli_runner.invoke(app, ["--no-color", "lint", str(p)])
+    res = cli_runner.invoke(app, ["--no-color", "lint", str(p)], catch_exceptions=False)
     assert res.exit_code == 1
     assert "ADL010" in res.stdout
 
@@ -82,7 +85,7 @@ def test_lint_json_is_valid_json(tmp_path: Path, cli_runner: CliRunner) -> None:
     p = tmp_path / "bad.adl"
     p.write_text(_minimal_adl_with_missing_sections(), encoding="utf-8")
 
-    res = cli_runner.invoke(app, ["lint", str(p), "--json"])
+    res = cli_runner.invoke(app, ["lint", str(p), "--json"], catch_exceptions=False)
     assert res.exit_code == 1
 
     payload = json.loads(res.stdout)
@@ -96,10 +99,12 @@ def test_lint_strict_treats_warn_as_error(
     p = tmp_path / "warn.adl"
     p.write_text(_adl_with_unknown_kind_but_complete_sections(), encoding="utf-8")
 
-    res = cli_runner.invoke(app, ["lint", str(p)])
+    res = cli_runner.invoke(app, ["lint", str(p)], catch_exceptions=False)
     assert res.exit_code == 0
 
-    res_strict = cli_runner.invoke(app, ["lint", str(p), "--strict", "--json"])
+    res_strict = cli_runner.invoke(
+        app, ["lint", str(p), "--strict", "--json"], catch_exceptions=False
+    )
     assert res_strict.exit_code == 1
     payload = json.loads(res_strict.stdout)
     assert any(item["code"] == "ADL020" for item in payload)
@@ -115,7 +120,7 @@ def test_validate_semantic_ok_exit_0(tmp_path: Path, cli_runner: CliRunner) -> N
         encoding="utf-8",
     )
 
-    res = cli_runner.invoke(app, ["validate", str(p), "--json"])
+    res = cli_runner.invoke(app, ["validate", str(p), "--json"], catch_exceptions=False)
     assert res.exit_code == 0
     assert json.loads(res.stdout) == []
 
@@ -151,7 +156,11 @@ def test_validate_with_rm_emits_bmm500(tmp_path: Path, cli_runner: CliRunner) ->
         encoding="utf-8",
     )
 
-    res = cli_runner.invoke(app, ["validate", str(tmpl), "--rm", str(rm_dir), "--json"])
+    res = cli_runner.invoke(
+        app,
+        ["validate", str(tmpl), "--rm", str(rm_dir), "--json"],
+        catch_exceptions=False,
+    )
     assert res.exit_code == 1
     payload = json.loads(res.stdout)
     assert any(item["code"] == "BMM500" for item in payload)
@@ -183,6 +192,7 @@ def test_compile_opt_writes_json_file(tmp_path: Path, cli_runner: CliRunner) ->
             str(out),
             "--json",
         ],
+        catch_exceptions=False,
     )
     assert res.exit_code == 0
     assert json.loads(res.stdout) == []
@@ -216,6 +226,7 @@ def test_compile_opt_invalid_repo_is_exit_2(
             str(out),
             "--json",
         ],
+        catch_exceptions=False,
     )
 
     assert res.exit_code == 2
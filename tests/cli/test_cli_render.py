@@ -1,3 +1,4 @@
+import io
 import json
 
 from rich.console import Console
@@ -7,7 +8,8 @@ from openehr_am.validation.issue import Issue, Severity
 
 
 def test_render_issues_rich_groups_by_file_and_sorts_by_line_col() -> None:
-    console = Console(record=True, width=120)
+    buf = io.StringIO()
+    console = Console(file=buf, width=120, force_terminal=False, color_system=None)
 
     issues = [
         Issue(
@@ -37,7 +39,7 @@ def test_render_issues_rich_groups_by_file_and_sorts_by_line_col() -> None:
     ]
 
     render_issues(issues, console=console, as_json=False)
-    out = console.export_text()
+    out = buf.getvalue()
 
     # Grouping: both file titles present.
     assert "a.adl" in out
@@ -48,7 +50,11 @@ def test_render_issues_rich_groups_by_file_and_sorts_by_line_col() -> None:
 
 
 def test_render_issues_json_is_strict_json_no_ansi_or_markup() -> None:
-    console = Console(record=True, width=120)
+    # A colour terminal: any styling or highlighting would show up as ANSI.
+    buf = io.StringIO()
+    console = Console(
+        file=buf, width=120, force_terminal=True, color_system="truecolor"
+    )
 
     issues = [
         Issue(code="AOM200", severity=Severity.ERROR, message="b", file="b.adl"),
@@ -56,7 +62,7 @@ def test_render_issues_json_is_strict_json_no_ansi_or_markup() -> None:
     ]
 
     render_issues(issues, console=console, as_json=True)
-    out = console.export_text()
+    out = buf.getvalue()
 
     # No ANSI escapes.
     assert "\x1b[" not in out
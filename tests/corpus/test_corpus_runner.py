@@ -1,4 +1,7 @@
+import os
+import re
 from dataclasses import dataclass
+from functools import cache
 from pathlib import Path
 
 import pytest
@@ -19,28 +22,27 @@ class CorpusResult:
     issues: tuple[Issue, ...]
 
 
+# First non-blank line, which must consist of the keyword alone.
+_ADL_KIND_RE = re.compile(r"\A\s*([A-Za-z_]+)[^\S\r\n]*(?:[\r\n]|\Z)")
+
+
 def _detect_adl_kind(text: str) -> str:
-    for line in text.splitlines():
-        stripped = line.strip()
-        if not stripped:
-            continue
-        head = stripped.casefold()
-        if head == "archetype":
-            return "archetype"
-        if head == "template":
-            return "template"
+    m = _ADL_KIND_RE.match(text)
+    if m is None:
         return "unknown"
-    return "unknown"
+    head = m.group(1).casefold()
+    return head if head in ("archetype", "template") else "unknown"
 
 
 def _run_adl(path: Path) -> CorpusResult:
     text = path.read_text(encoding="utf-8")
     kind = _detect_adl_kind(text)
 
+    # Parse the text already read (same filename as `path=` would use).
     if kind == "template":
-        obj, parse_issues = parse_template(path=path)
+        obj, parse_issues = parse_template(text=text, filename=str(path))
     elif kind == "archetype":
-        obj, parse_issues = parse_archetype(path=path)
+        obj, parse_issues = parse_archetype(text=text, filename=str(path))
     else:
         # Fallback: validate syntax only.
         obj = None
@@ -70,6 +72,9 @@ def _run_odin(path: Path) -> CorpusResult:
     )
 
 
+# Results are immutable, so tests that look at the same corpus file (e.g. the
+# snapshot test) share one parse + validate run per session.
+@cache
 def _run_corpus_file(path: Path) -> CorpusResult:
     match path.suffix:
         case ".adl":
@@ -83,14 +88,15 @@ def _run_corpus_file(path: Path) -> CorpusResult:
 def _corpus_files() -> list[Path]:
     root = repo_root()
     corpus_dir = root / "tests" / "corpus"
-    return sorted(
-        [
-            p
-            for p in corpus_dir.iterdir()
-            if p.is_file() and p.suffix in {".adl", ".odin"}
-        ],
-        key=lambda p: p.name,
-    )
+    # scandir entries answer is_file()/name from the directory listing, so
+    # collection does not stat every file.
+    with os.scandir(corpus_dir) as entries:
+        paths = [
+            Path(e.path)
+            for e in entries
+            if e.name.endswith((".adl", ".odin")) and e.is_file()
+        ]
+    return sorted(paths, key=lambda p: p.name)
 
 
 @pytest.mark.parametrize("path", _corpus_files(), ids=lambda p: p.name)
@@ -1,11 +1,16 @@
+from functools import cache
 from pathlib import Path
 
 _FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
 
+@cache
 def fixture_path(*parts: str) -> Path:
     return _FIXTURES_DIR.joinpath(*parts)
 
 
+# Fixtures are read-only during a run and `str` is immutable, so tests can
+# share one decoded copy.
+@cache
 def load_fixture_text(*parts: str) -> str:
     return fixture_path(*parts).read_text(encoding="utf-8")
@@ -1,25 +1,36 @@
+import os
 import random
 import string
 
+import pytest
+
 from openehr_am.adl.parser import parse_adl
 from openehr_am.odin.parser import parse_odin
 
+_ALPHABET = string.ascii_letters + string.digits + string.punctuation + " \t\n"
+
+# Samples are split into independent seeded shards so test runners can spread
+# them across workers. Set FUZZ_ITERS to run more samples (e.g. nightly).
+_SHARDS = 16
+_ITERS_PER_SHARD = -(-int(os.environ.get("FUZZ_ITERS", "300")) // _SHARDS)
+
 
 def _random_text(rng: random.Random, *, max_len: int) -> str:
-    alphabet = string.ascii_letters + string.digits + string.punctuation + " \t\n"
     n = rng.randint(0, max_len)
-    return "".join(rng.choice(alphabet) for _ in range(n))
+    return "".join(rng.choices(_ALPHABET, k=n))
 
 
-def test_fuzz_no_crash_adl() -> None:
-    rng = random.Random(0)
-    for i in range(300):
+@pytest.mark.parametrize("seed", range(_SHARDS))
+def test_fuzz_no_crash_adl(seed: int) -> None:
+    rng = random.Random(seed)
+    for i in range(_ITERS_PER_SHARD):
         text = _random_text(rng, max_len=400)
-        parse_adl(text, filename=f"fuzz_adl_{i}.adl")
+        parse_adl(text, filename=f"fuzz_adl_{seed}_{i}.adl")
 
 
-def test_fuzz_no_crash_odin() -> None:
-    rng = random.Random(0)
-    for i in range(300):
+@pytest.mark.parametrize("seed", range(_SHARDS))
+def test_fuzz_no_crash_odin(seed: int) -> None:
+    rng = random.Random(seed)
+    for i in range(_ITERS_PER_SHARD):
         text = _random_text(rng, max_len=400)
-        parse_odin(text, filename=f"fuzz_odin_{i}.odin")
+        parse_odin(text, filename=f"fuzz_odin_{seed}_{i}.odin")
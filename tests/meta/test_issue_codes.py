@@ -1,92 +1,88 @@
 import re
 from pathlib import Path
 
+import pytest
+
 from openehr_am.validation.issue import validate_issue_code
 from tests.repo_root import repo_root
+from tests.support.package_sources import package_sources
 
-_CODE_RE = re.compile(r"\b(?:ADL|ODN|AQL|AOM|BMM|OPT|PATH|CLI)\d{3}\b")
+# Bytes pattern: sources are scanned without decoding them.
+_CODE_RE = re.compile(rb"\b(?:ADL|ODN|AQL|AOM|BMM|OPT|PATH|CLI)\d{3}\b")
 
 
 def _repo_root() -> Path:
     return repo_root(Path(__file__).resolve())
 
 
-def _iter_python_source_files(root: Path) -> list[Path]:
-    src_root = root / "openehr_am"
-    paths: list[Path] = []
-    for p in src_root.rglob("*.py"):
-        if "_generated" in p.parts:
-            continue
-        paths.append(p)
-    return sorted(paths)
-
-
-def _extract_codes(text: str) -> set[str]:
-    return set(_CODE_RE.findall(text))
-
-
-def test_validate_issue_code_accepts_known_prefixes_and_ranges() -> None:
-    assert validate_issue_code("ADL001")
-    assert validate_issue_code("ADL199")
-
-    assert validate_issue_code("ODN100")
-    assert validate_issue_code("ODN199")
-
-    assert validate_issue_code("AQL100")
-    assert validate_issue_code("AQL199")
-
-    assert validate_issue_code("AOM200")
-    assert validate_issue_code("AOM499")
-
-    assert validate_issue_code("BMM500")
-    assert validate_issue_code("BMM699")
-
-    assert validate_issue_code("OPT700")
-    assert validate_issue_code("OPT899")
-
-    assert validate_issue_code("PATH900")
-    assert validate_issue_code("PATH999")
-
-    assert validate_issue_code("CLI001")
-    assert validate_issue_code("CLI199")
-
-
-def test_validate_issue_code_rejects_wrong_format_or_range() -> None:
-    assert not validate_issue_code("")
-    assert not validate_issue_code("adl001")  # must be uppercase
-    assert not validate_issue_code("ADL01")  # must be ###
-    assert not validate_issue_code("ADL000")  # below range
-    assert not validate_issue_code("ADL200")  # above range
-
-    assert not validate_issue_code("ODN099")
-    assert not validate_issue_code("ODN200")
-
-    assert not validate_issue_code("AQL099")
-    assert not validate_issue_code("AQL200")
-
-    assert not validate_issue_code("AOM199")
-    assert not validate_issue_code("AOM500")
-
-    assert not validate_issue_code("PATH089")
-    assert not validate_issue_code("PATH1000")
-
-    assert not validate_issue_code("CLI000")
-    assert not validate_issue_code("CLI200")
-    assert not validate_issue_code("CLI999")
-
-    assert not validate_issue_code("XYZ123")  # unknown prefix
+def _iter_python_sources() -> list[bytes]:
+    return [data for path, data in package_sources() if "_generated" not in path.parts]
+
+
+def _extract_codes(data: bytes) -> set[str]:
+    return {m.group().decode("ascii") for m in _CODE_RE.finditer(data)}
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "ADL001",
+        "ADL199",
+        "ODN100",
+        "ODN199",
+        "AQL100",
+        "AQL199",
+        "AOM200",
+        "AOM499",
+        "BMM500",
+        "BMM699",
+        "OPT700",
+        "OPT899",
+        "PATH900",
+        "PATH999",
+        "CLI001",
+        "CLI199",
+    ],
+)
+def test_validate_issue_code_accepts_known_prefixes_and_ranges(code: str) -> None:
+    assert validate_issue_code(code)
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "",
+        "adl001",  # must be uppercase
+        "ADL01",  # must be ###
+        "ADL000",  # below range
+        "ADL200",  # above range
+        "ODN099",
+        "ODN200",
+        "AQL099",
+        "AQL200",
+        "AOM199",
+        "AOM500",
+        "PATH089",
+        "PATH1000",
+        "CLI000",
+        "CLI200",
+        "CLI999",
+        "XYZ123",  # unknown prefix
+        "ADL1²3",  # digits must be ASCII
+    ],
+)
+def test_validate_issue_code_rejects_wrong_format_or_range(code: str) -> None:
+    assert not validate_issue_code(code)
 
 
 def test_issue_codes_used_in_source_are_documented() -> None:
     root = _repo_root()
 
-    documented = _extract_codes(
-        (root / "docs" / "issue-codes.md").read_text(encoding="utf-8")
-    )
+    documented = _extract_codes((root / "docs" / "issue-codes.md").read_bytes())
 
-    used: set[str] = set()
-    for path in _iter_python_source_files(root):
-        used |= _extract_codes(path.read_text(encoding="utf-8"))
+    # One scan over all sources; NUL separators keep a match from spanning
+    # two files.
+    used = _extract_codes(b"\0".join(_iter_python_sources()))
 
     # Only enforce “used ⊆ documented”. The docs can mention future codes.
     missing = sorted(used - documented)
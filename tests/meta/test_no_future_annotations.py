@@ -1,17 +1,17 @@
 from pathlib import Path
 
 from tests.repo_root import repo_root
+from tests.support.package_sources import package_sources
 
 
 def test_no_future_annotations_import_in_openehr_am() -> None:
     package_root = repo_root(Path(__file__).resolve()) / "openehr_am"
 
     offenders: list[Path] = []
-    needle = "from __future__ import annotations"
+    needle = b"from __future__ import annotations"
 
-    for path in package_root.rglob("*.py"):
-        text = path.read_text(encoding="utf-8", errors="replace")
-        if needle in text:
+    for path, data in package_sources():
+        if needle in data:
             offenders.append(path.relative_to(package_root.parent))
 
     assert offenders == [], (
@@ -1,3 +1,5 @@
+import pytest
+
 from openehr_am.odin.ast import OdinInteger, OdinObject
 from openehr_am.odin.parser import parse_odin
 from openehr_am.validation.issue import Severity
@@ -30,6 +32,15 @@ def test_parse_odin_returns_issue_on_missing_block_end() -> None:
     assert issues[0].code == "ODN100"
 
 
+@pytest.mark.parametrize("number", ["9e", "9E+", "9e-", "1.5e"])
+def test_parse_odin_returns_issue_on_exponent_without_digits(number: str) -> None:
+    node, issues = parse_odin(f"a = <{number}>")
+
+    assert node is None
+    assert [(i.code, i.line, i.col) for i in issues] == [("ODN100", 1, 6)]
+    assert "exponent" in issues[0].message
+
+
 def test_parse_odin_never_raises_on_various_malformed_inputs() -> None:
     samples = [
         "<",
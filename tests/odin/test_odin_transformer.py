@@ -20,6 +20,8 @@ class Tok:
 
 
 class Ctx:
+    __slots__ = ("_text", "start", "stop")
+
     def __init__(self, text: str, *, start: Tok | None = None, stop: Tok | None = None):
         self._text = text
         self.start = start
@@ -30,22 +32,24 @@ class Ctx:
 
 
 class StringValueCtx(Ctx):
-    pass
+    __slots__ = ()
 
 
 class IntegerValueCtx(Ctx):
-    pass
+    __slots__ = ()
 
 
 class RealValueCtx(Ctx):
-    pass
+    __slots__ = ()
 
 
 class BooleanValueCtx(Ctx):
-    pass
+    __slots__ = ()
 
 
 class PrimitiveValueCtx(Ctx):
+    __slots__ = ("_child",)
+
     def __init__(self, child: Ctx):
         super().__init__(child.getText(), start=child.start, stop=child.stop)
         self._child = child
@@ -64,6 +68,8 @@ class PrimitiveValueCtx(Ctx):
 
 
 class PrimitiveObjectCtx(Ctx):
+    __slots__ = ("_primitive",)
+
     def __init__(self, primitive: Ctx):
         super().__init__(
             primitive.getText(), start=primitive.start, stop=primitive.stop
@@ -84,6 +90,8 @@ class PrimitiveObjectCtx(Ctx):
 
 
 class PrimitiveListValueCtx(Ctx):
+    __slots__ = ("_values",)
+
     def __init__(
         self, values: list[PrimitiveValueCtx], text: str, start: Tok, stop: Tok
     ):
@@ -95,10 +103,12 @@ class PrimitiveListValueCtx(Ctx):
 
 
 class AttributeIdCtx(Ctx):
-    pass
+    __slots__ = ()
 
 
 class AttrValCtx(Ctx):
+    __slots__ = ("_attr_id", "_obj_block")
+
     def __init__(self, attr_id: AttributeIdCtx, obj_block: Ctx, start: Tok, stop: Tok):
         super().__init__(
             f"{attr_id.getText()}={obj_block.getText()}", start=start, stop=stop
@@ -114,6 +124,8 @@ class AttrValCtx(Ctx):
 
 
 class AttrValsCtx(Ctx):
+    __slots__ = ("_attr_vals",)
+
     def __init__(self, attr_vals: list[AttrValCtx], start: Tok, stop: Tok):
         super().__init__("", start=start, stop=stop)
         self._attr_vals = attr_vals
@@ -123,6 +135,8 @@ class AttrValsCtx(Ctx):
 
 
 class ObjectBlockCtx(Ctx):
+    __slots__ = ("_ovb",)
+
     def __init__(self, ovb: Ctx):
         super().__init__(ovb.getText(), start=ovb.start, stop=ovb.stop)
         self._ovb = ovb
@@ -132,6 +146,8 @@ class ObjectBlockCtx(Ctx):
 
 
 class ObjectValueBlockCtx(Ctx):
+    __slots__ = ("_primitive_object", "_attr_vals", "_keyed_objects")
+
     def __init__(
         self,
         *,
@@ -158,6 +174,8 @@ class ObjectValueBlockCtx(Ctx):
 
 
 class KeyedObjectCtx(Ctx):
+    __slots__ = ("_key", "_obj_block")
+
     def __init__(
         self, key: PrimitiveValueCtx, obj_block: ObjectBlockCtx, start: Tok, stop: Tok
     ):
@@ -173,6 +191,8 @@ class KeyedObjectCtx(Ctx):
 
 
 class OdinTextCtx(Ctx):
+    __slots__ = ("_child",)
+
     def __init__(self, child: Ctx):
         super().__init__(child.getText(), start=child.start, stop=child.stop)
         self._child = child
@@ -1,5 +1,11 @@
+import pytest
+
 from openehr_am.aom.constraints import CAttribute, CComplexObject
-from openehr_am.path.resolver import resolve_path
+from openehr_am.path.resolver import (
+    PathResolutionCache,
+    resolve_path,
+    resolve_path_cached,
+)
 
 
 def _example_tree() -> CComplexObject:
@@ -64,3 +70,27 @@ def test_resolve_path_emits_path910_when_no_nodes_match():
     assert nodes == ()
     assert len(issues) == 1
     assert issues[0].code == "PATH910"
+
+
+def test_resolve_path_cached_matches_resolve_path():
+    root = _example_tree()
+    cache = PathResolutionCache(root)
+
+    for path in (
+        "/definition/data[at0001]/events[at0002]",
+        "/data[at0001]/events",
+        "/data[at0001]/events[at0003]",
+        "/definition/data[at9999]",
+        "/data[at0001]/events[at0002]/nope",
+        "not a path",
+    ):
+        assert resolve_path_cached(root, path, cache=cache) == resolve_path(root, path)
+        # Second lookup is served from the trie and must be identical.
+        assert resolve_path_cached(root, path, cache=cache) == resolve_path(root, path)
+
+
+def test_resolve_path_cached_rejects_cache_for_other_definition():
+    cache = PathResolutionCache(_example_tree())
+
+    with pytest.raises(ValueError):
+        resolve_path_cached(_example_tree(), "/data", cache=cache)
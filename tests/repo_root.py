@@ -1,11 +1,14 @@
+from functools import cache
 from pathlib import Path
 
 
+@cache
 def repo_root(start: Path | None = None) -> Path:
     """Return the repository root by searching upward for pyproject.toml.
 
     This is intentionally filesystem-based (not import-based) so it keeps
-    working if tests are moved into deeper subdirectories.
+    working if tests are moved into deeper subdirectories. Results are cached
+    per `start`, since the tree does not move during a test run.
     """
 
     base = (start or Path(__file__).resolve()).resolve()
@@ -5,11 +5,12 @@ from openehr_am.validation.issue import Issue
 
 
 def _normalize_file(file: str | None, *, root: Path | None) -> str | None:
+    # `root` is expected to be resolved already (see `format_issues`).
     if file is None or root is None:
         return file
 
     try:
-        rel = Path(file).resolve().relative_to(root.resolve())
+        rel = Path(file).resolve().relative_to(root)
     except (OSError, RuntimeError, ValueError):
         return file
 
@@ -47,8 +48,9 @@ def _format_location(
     return f"{file}:{line}:{col}-{end_line}:{end_col}"
 
 
-def _sort_key(issue: Issue, *, root: Path | None) -> tuple[object, ...]:
-    file = _normalize_file(issue.file, root=root)
+def _sort_key(issue: Issue) -> tuple[object, ...]:
+    # Called on already-normalised Issues.
+    file = issue.file
     return (
         file is None,
         file or "",
@@ -69,6 +71,12 @@ def format_issues(issues: list[Issue] | tuple[Issue, ...], *, root: Path | None)
     - Uses a stable single-line format per Issue.
     """
 
+    if root is not None:
+        try:
+            root = root.resolve()
+        except (OSError, RuntimeError):
+            root = None
+
     normalized: list[Issue] = []
     for issue in issues:
         file = _normalize_file(issue.file, root=root)
@@ -77,7 +85,7 @@ def format_issues(issues: list[Issue] | tuple[Issue, ...], *, root: Path | None)
         else:
             normalized.append(issue)
 
-    normalized.sort(key=lambda i: _sort_key(i, root=root))
+    normalized.sort(key=_sort_key)
 
     lines: list[str] = []
     for issue in normalized:
@@ -0,0 +1,23 @@
+import os
+from functools import cache
+from pathlib import Path
+
+from tests.repo_root import repo_root
+
+
+@cache
+def package_sources() -> tuple[tuple[Path, bytes], ...]:
+    """Return `(path, contents)` for every `.py` file under `openehr_am/`.
+
+    Files are sorted by path and read once per test session; meta tests that
+    scan the package source share this instead of each walking the tree.
+    """
+
+    package_root = repo_root(Path(__file__).resolve()) / "openehr_am"
+    paths = [
+        Path(dirpath, name)
+        for dirpath, _dirnames, filenames in os.walk(package_root)
+        for name in filenames
+        if name.endswith(".py")
+    ]
+    return tuple((p, p.read_bytes()) for p in sorted(paths))
@@ -108,3 +108,38 @@ def test_validate_opt_duplicate_object_paths_emits_opt750() -> None:
 
     assert any(i.code == "OPT750" for i in issues)
     assert any("Duplicate object path" in i.message for i in issues)
+
+
+def test_validate_opt_handles_definitions_deeper_than_recursion_limit() -> None:
+    import sys
+
+    from openehr_am.opt.model import (
+        OperationalTemplate,
+        OptCAttribute,
+        OptCComplexObject,
+    )
+
+    depth = sys.getrecursionlimit() + 100
+    paths = ["/" + "/".join(["items"] * i) if i else "/" for i in range(depth + 1)]
+
+    # The innermost object carries a node id that is not in its path.
+    node = OptCComplexObject(
+        rm_type_name="ELEMENT", node_id="at0001", path=paths[depth]
+    )
+    for i in range(depth - 1, -1, -1):
+        node = OptCComplexObject(
+            rm_type_name="CLUSTER",
+            path=paths[i],
+            attributes=(
+                OptCAttribute(
+                    rm_attribute_name="items", path=paths[i + 1], children=(node,)
+                ),
+            ),
+        )
+
+    opt = OperationalTemplate(template_id="t.v1", definition=node)
+
+    issues = validate_opt(opt)
+
+    assert [i.message for i in issues] == ["OPT object node_id not reflected in path"]
+    assert issues[0].path == paths[depth]
@@ -239,3 +239,46 @@ def test_validate_rm_does_not_emit_bmm520_when_within_rm(tmp_path: Path) -> None
 
     issues = validate_rm(aom, rm_repo=repo)
     assert not any(i.code == "BMM520" for i in issues)
+
+
+def test_validate_rm_handles_definitions_deeper_than_recursion_limit(
+    tmp_path: Path,
+) -> None:
+    import sys
+
+    rm_dir = tmp_path / "rm"
+    rm_dir.mkdir()
+
+    (rm_dir / "rm.bmm").write_text(
+        """
+<
+    model_name = <\"RM\">
+    packages = <
+        [\"rm\"] = <
+            classes = <
+                [\"CLUSTER\"] = <
+                    properties = <
+                        [\"items\"] = < type = <\"String\"> >
+                    >
+                >
+            >
+        >
+    >
+>
+""".strip(),
+        encoding="utf-8",
+    )
+
+    repo, _issues = ModelRepository.load_from_dir(rm_dir)
+
+    node = CComplexObject(rm_type_name="DOES_NOT_EXIST", node_id="at0001")
+    for _ in range(sys.getrecursionlimit() + 100):
+        node = CComplexObject(
+            rm_type_name="CLUSTER",
+            attributes=(CAttribute(rm_attribute_name="items", children=(node,)),),
+        )
+
+    aom = Archetype(archetype_id="openEHR-EHR-CLUSTER.deep.v1", definition=node)
+
+    issues = validate_rm(aom, rm_repo=repo)
+    assert [(i.code, i.node_id) for i in issues] == [("BMM500", "at0001")]
@@ -1,5 +1,11 @@
+import importlib
+import sys
+
+import pytest
+
 from openehr_am.validation.context import ValidationContext
 from openehr_am.validation.issue import Issue, Severity
+from openehr_am.validation.registry import ValidationRegistry
 from openehr_am.validation.semantic import register_semantic_check, validate_semantic
 
 
@@ -729,6 +735,87 @@ def test_validate_semantic_aom250_invalid_occurrences_interval_emitted() -> None
     assert issues[0].path == "/definition/occurrences"
 
 
+def test_aom250_valid_bounded_occurrences_render_no_paths(monkeypatch) -> None:
+    from openehr_am.aom.archetype import Archetype
+    from openehr_am.aom.constraints import CAttribute, CComplexObject, Interval
+    from openehr_am.validation import semantic_checks
+    from openehr_am.validation.context import ValidationContext
+
+    rendered: list[object] = []
+    render_path = semantic_checks._render_path
+
+    def counting_render_path(segment):
+        rendered.append(segment)
+        return render_path(segment)
+
+    monkeypatch.setattr(semantic_checks, "_render_path", counting_render_path)
+
+    # Typical archetype shape: every node carries a valid 0..1 or 1..1.
+    definition = CComplexObject(
+        rm_type_name="OBSERVATION",
+        node_id="at0000",
+        occurrences=Interval(1, 1),
+        attributes=(
+            CAttribute(
+                rm_attribute_name="items",
+                children=tuple(
+                    CComplexObject(
+                        rm_type_name="ELEMENT",
+                        node_id=f"at000{i}",
+                        occurrences=Interval(0, 1),
+                    )
+                    for i in range(1, 4)
+                ),
+            ),
+        ),
+    )
+    aom = Archetype(archetype_id="openEHR-EHR-OBSERVATION.x.v1", definition=definition)
+
+    ctx = ValidationContext(artefact=aom)
+    assert list(semantic_checks.check_interval_invariants(ctx)) == []
+    assert rendered == []
+
+
+def test_validate_semantic_aom250_spanless_issues_follow_definition_order() -> None:
+    from openehr_am.aom.archetype import Archetype
+    from openehr_am.aom.constraints import (
+        Cardinality,
+        CAttribute,
+        CComplexObject,
+        Interval,
+    )
+
+    # Without spans the Issues share a sort key, so their order is the walk
+    # order: attribute `a`'s subtree before attribute `b`'s cardinality.
+    definition = CComplexObject(
+        rm_type_name="OBSERVATION",
+        attributes=(
+            CAttribute(
+                rm_attribute_name="a",
+                children=(
+                    CComplexObject(
+                        rm_type_name="CLUSTER",
+                        occurrences=Interval(lower=3, upper=1),
+                    ),
+                ),
+            ),
+            CAttribute(
+                rm_attribute_name="b",
+                cardinality=Cardinality(occurrences=Interval(lower=3, upper=1)),
+            ),
+        ),
+    )
+    aom = Archetype(
+        archetype_id="openEHR-EHR-OBSERVATION.spanless.v1", definition=definition
+    )
+
+    issues = [i for i in validate_semantic(aom) if i.code == "AOM250"]
+    assert [i.path for i in issues] == [
+        "/definition/a/occurrences",
+        "/definition/b/cardinality",
+    ]
+
+
 def test_validate_semantic_aom250_invalid_primitive_interval_emitted() -> None:
     from openehr_am.antlr.span import SourceSpan
     from openehr_am.aom.archetype import Archetype
@@ -982,3 +1069,250 @@ def test_validate_semantic_aom270_missing_original_language_and_languages_emitte
         "/languages",
         "/terminology/original_language",
     }
+
+
+def test_validate_semantic_handles_definitions_deeper_than_recursion_limit() -> None:
+    import sys
+
+    from openehr_am.aom.archetype import Archetype
+    from openehr_am.aom.constraints import CAttribute, CComplexObject, Interval
+
+    depth = sys.getrecursionlimit() + 100
+
+    node = CComplexObject(
+        rm_type_name="ELEMENT", occurrences=Interval(lower=2, upper=1)
+    )
+    for _ in range(depth):
+        node = CComplexObject(
+            rm_type_name="CLUSTER",
+            attributes=(CAttribute(rm_attribute_name="items", children=(node,)),),
+        )
+
+    aom = Archetype(
+        archetype_id="openEHR-EHR-CLUSTER.deep.v1",
+        original_language="en",
+        languages=("en",),
+        definition=node,
+    )
+
+    issues = validate_semantic(aom)
+
+    assert [i.code for i in issues] == ["AOM250"]
+    assert issues[0].path is not None
+    assert issues[0].path.endswith("/items/occurrences")
+
+
+def test_validate_semantic_aom290_repeated_rule_paths_reported_per_statement() -> None:
+    from openehr_am.antlr.span import SourceSpan
+    from openehr_am.aom.archetype import Archetype, RuleStatement
+    from openehr_am.aom.constraints import CAttribute, CComplexObject
+    from openehr_am.aom.terminology import ArchetypeTerminology, TermDefinition
+
+    def stmt_span(line: int) -> SourceSpan:
+        return SourceSpan(
+            file="rules.adl", start_line=line, start_col=1, end_line=line, end_col=30
+        )
+
+    definition = CComplexObject(
+        rm_type_name="OBSERVATION",
+        node_id="at0000",
+        attributes=(
+            CAttribute(
+                rm_attribute_name="data",
+                children=(CComplexObject(rm_type_name="HISTORY", node_id="at0001"),),
+            ),
+        ),
+    )
+
+    terminology = ArchetypeTerminology(
+        original_language="en",
+        term_definitions=(
+            TermDefinition(language="en", code="at0000", text="Root"),
+            TermDefinition(language="en", code="at0001", text="Child"),
+        ),
+    )
+
+    aom = Archetype(
+        archetype_id="openEHR-EHR-OBSERVATION.rules.v1",
+        concept="at0000",
+        original_language="en",
+        languages=("en",),
+        definition=definition,
+        terminology=terminology,
+        rules=(
+            RuleStatement(text="assert /data[at0001] and /bad", span=stmt_span(20)),
+            RuleStatement(text="assert /data[at0001] or /bad", span=stmt_span(21)),
+        ),
+    )
+
+    issues = validate_semantic(aom)
+    aom290 = [i for i in issues if i.code == "AOM290"]
+    assert [(i.line, i.path) for i in aom290] == [(20, "/bad"), (21, "/bad")]
+
+
+def test_validate_semantic_custom_registry_runs_only_its_own_checks() -> None:
+    from openehr_am.aom.archetype import Archetype
+    from openehr_am.validation.registry import ValidationRegistry
+
+    registry = ValidationRegistry()
+    register_semantic_check(lambda _ctx: (), name="noop", registry=registry)
+
+    # Would trigger AOM210/AOM270 with the default checks.
+    aom = Archetype(archetype_id="openEHR-EHR-OBSERVATION.x.v1", concept="bogus")
+
+    assert validate_semantic(aom, registry=registry) == ()
+    assert {i.code for i in validate_semantic(aom)} >= {"AOM210", "AOM270"}
+
+
+_CHECKS_MODULE = "openehr_am.validation.semantic_checks"
+
+
+def _unload_default_checks(monkeypatch) -> ValidationRegistry:
+    # Make the next `validate_semantic` call load the default checks again, into
+    # a fresh built-in registry; monkeypatch restores the real ones afterwards.
+    import openehr_am.validation as validation_pkg
+    from openehr_am.validation import semantic
+
+    monkeypatch.delitem(sys.modules, _CHECKS_MODULE, raising=False)
+    monkeypatch.delattr(validation_pkg, "semantic_checks", raising=False)
+    builtin = ValidationRegistry()
+    monkeypatch.setattr(semantic, "_BUILTIN_REGISTRY", builtin)
+    monkeypatch.setattr(semantic, "DEFAULT_REGISTRY", builtin)
+    monkeypatch.setattr(semantic, "_default_checks_loaded", False)
+    return builtin
+
+
+def test_import_semantic_does_not_import_default_checks(monkeypatch) -> None:
+    import openehr_am.validation as validation_pkg
+    from openehr_am.validation import semantic
+
+    monkeypatch.delitem(sys.modules, "openehr_am.validation.semantic")
+    monkeypatch.setattr(validation_pkg, "semantic", semantic)
+    _unload_default_checks(monkeypatch)
+
+    importlib.import_module("openehr_am.validation.semantic")
+
+    assert _CHECKS_MODULE not in sys.modules
+
+
+def test_validate_semantic_loads_default_checks_on_first_use(monkeypatch) -> None:
+    from openehr_am.aom.archetype import Archetype
+    from openehr_am.validation import semantic
+
+    _unload_default_checks(monkeypatch)
+    aom = Archetype(archetype_id="openEHR-EHR-OBSERVATION.x.v1", concept="bogus")
+
+    issues = validate_semantic(aom)
+
+    assert {"AOM210", "AOM270"} <= {i.code for i in issues}
+    assert semantic._default_checks_loaded
+    assert _CHECKS_MODULE in sys.modules
+
+
+def test_default_checks_register_into_builtin_registry_despite_monkeypatch(
+    monkeypatch,
+) -> None:
+    from openehr_am.aom.archetype import Archetype
+    from openehr_am.validation import semantic
+
+    builtin = _unload_default_checks(monkeypatch)
+    aom = Archetype(archetype_id="openEHR-EHR-OBSERVATION.x.v1", concept="bogus")
+
+    # Importing semantic_checks while DEFAULT_REGISTRY is patched must not
+    # divert the built-in registrations into the patched registry.
+    patched = ValidationRegistry()
+    monkeypatch.setattr(semantic, "DEFAULT_REGISTRY", patched)
+    importlib.import_module(_CHECKS_MODULE)
+    monkeypatch.setattr(semantic, "DEFAULT_REGISTRY", builtin)
+
+    assert patched.run(ValidationContext(artefact=aom)) == ()
+    assert {"AOM210", "AOM270"} <= {i.code for i in validate_semantic(aom)}
+
+
+def test_validate_semantic_batch_matches_serial_results_in_input_order() -> None:
+    from openehr_am.aom.archetype import Archetype
+    from openehr_am.validation.semantic import validate_semantic_batch
+
+    aoms = [
+        Archetype(archetype_id=f"openEHR-EHR-OBSERVATION.x{i}.v1", concept=concept)
+        for i, concept in enumerate(("bogus", "at0000", None, "ac0001.x") * 3)
+    ]
+
+    expected = [validate_semantic(aom) for aom in aoms]
+
+    assert validate_semantic_batch(aoms) == expected
+    assert validate_semantic_batch(aoms, max_workers=3) == expected
+
+
+def test_validate_semantic_definition_checks_share_one_walk() -> None:
+    from openehr_am.aom.archetype import Archetype
+    from openehr_am.aom.constraints import (
+        CAttribute,
+        CComplexObject,
+        CPrimitiveObject,
+        Interval,
+        PrimitiveIntegerConstraint,
+    )
+
+    definition = CComplexObject(
+        rm_type_name="OBSERVATION",
+        node_id="at0000",
+        attributes=(
+            CAttribute(
+                rm_attribute_name="data",
+                children=(
+                    CComplexObject(rm_type_name="ELEMENT", node_id="bad"),
+                    CComplexObject(rm_type_name="ELEMENT", node_id="at0001.1"),
+                    CPrimitiveObject(
+                        rm_type_name="INTEGER",
+                        constraint=PrimitiveIntegerConstraint(
+                            interval=Interval(lower=5, upper=1)
+                        ),
+                    ),
+                ),
+            ),
+            CAttribute(rm_attribute_name="data"),
+        ),
+    )
+
+    aom = Archetype(
+        archetype_id="openEHR-EHR-OBSERVATION.fused.v1",
+        concept="at0000",
+        original_language="en",
+        languages=("en",),
+        definition=definition,
+    )
+
+    issues = validate_semantic(aom)
+
+    by_code = {i.code: i for i in issues if i.code != "AOM200"}
+    assert sorted(by_code) == ["AOM210", "AOM230", "AOM240", "AOM250"]
+    assert by_code["AOM210"].node_id == "bad"
+    assert by_code["AOM230"].node_id == "at0001.1"
+    assert by_code["AOM240"].path == "/definition/data"
+    assert by_code["AOM250"].path == "/definition/data/constraint"
+
+
+@pytest.mark.parametrize(
+    ("node_id", "valid"),
+    [
+        ("at0001", True),
+        ("ac0001", True),
+        ("at0001.1", True),
+        ("at0001.01", True),
+        ("at0001.1.12", True),
+        ("at0001.0", False),
+        ("at0001.", False),
+        ("at0001..1", False),
+        ("at00011", False),
+        ("ab0001", False),
+        ("at000١", False),
+    ],
+)
+def test_validate_semantic_aom210_node_id_grammar(node_id: str, valid: bool) -> None:
+    from openehr_am.aom.archetype import Archetype
+
+    aom = Archetype(archetype_id="openEHR-EHR-OBSERVATION.ids.v1", concept=node_id)
+
+    aom210 = [i.node_id for i in validate_semantic(aom) if i.code == "AOM210"]
+    assert aom210 == ([] if valid else [node_id])
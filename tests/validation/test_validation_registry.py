@@ -1,3 +1,5 @@
+import pytest
+
 from openehr_am.validation.context import ValidationContext
 from openehr_am.validation.issue import Issue, Severity
 from openehr_am.validation.registry import ValidationLayer, ValidationRegistry
@@ -95,3 +97,58 @@ def test_registry_returns_issues_sorted_deterministically() -> None:
     issues = registry.run(ValidationContext(artefact=object()))
 
     assert [issue.file for issue in issues] == ["a", "b"]
+
+
+def test_registry_run_returns_empty_tuple_when_no_checks_selected() -> None:
+    registry = ValidationRegistry()
+
+    def check_syntax(_ctx: ValidationContext):
+        raise AssertionError("syntax check must not run")
+
+    registry.register(ValidationLayer.SYNTAX, check_syntax)
+
+    issues = registry.run(
+        ValidationContext(artefact=object()), layers=[ValidationLayer.RM]
+    )
+
+    assert issues == ()
+
+
+def test_validation_context_cache_is_per_context_and_ignored_by_equality() -> None:
+    artefact = object()
+    a = ValidationContext(artefact=artefact)
+    b = ValidationContext(artefact=artefact)
+
+    a.cache["key"] = 1
+
+    assert b.cache == {}
+    assert a == b
+
+
+def test_registry_rejects_the_same_check_registered_twice() -> None:
+    registry = ValidationRegistry()
+
+    def check(_ctx: ValidationContext):
+        return []
+
+    registry.register(ValidationLayer.SEMANTIC, check, name="dup")
+
+    with pytest.raises(ValueError, match="already registered"):
+        registry.register(ValidationLayer.SEMANTIC, check, name="dup")
+
+
+def test_registry_allows_distinct_local_checks_sharing_a_name() -> None:
+    registry = ValidationRegistry()
+
+    def make_check():
+        def check(_ctx: ValidationContext):
+            return []
+
+        return check
+
+    # Same name and qualname, distinct checks (as after a module reload): only
+    # identity counts.
+    registry.register(ValidationLayer.SEMANTIC, make_check(), name="dup")
+    registry.register(ValidationLayer.SEMANTIC, make_check(), name="dup")
+    registry.register(ValidationLayer.SEMANTIC, lambda _ctx: [], name="dup")
+    registry.register(ValidationLayer.SEMANTIC, lambda _ctx: [], name="dup")